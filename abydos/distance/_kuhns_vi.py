@@ -145,6 +145,9 @@ class KuhnsVI(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
+        if not src or not tar:
+            return 0.0
+
         self._tokenize(src, tar)
 
         a = self._intersection_card()
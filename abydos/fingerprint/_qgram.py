@@ -97,7 +97,7 @@ class QGram(_Fingerprint):
         phrase = unicode_normalize('NFKD', phrase.strip().lower())
         phrase = ''.join(c for c in phrase if c.isalnum())
         phrase = self._joiner.join(
-            sorted(self._tokenizer.tokenize(phrase).get_set())
+            sorted(self._tokenizer.tokenize(phrase).get_keys())
         )
         return phrase
 
@@ -20,9 +20,8 @@ IBM's Alpha Search Inquiry System coding
 """
 
 from typing import Dict, List, Tuple, Union
-from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['AlphaSIS']
 
@@ -247,8 +246,8 @@ class AlphaSIS(_Phonetic):
         """
         alpha = ['']
         pos = 0
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = _nfkd_upper(word)
+        word = word.translate(self._uc_trans)
 
         # Do special processing for initial substrings
         for k in self._alpha_sis_initials_order:
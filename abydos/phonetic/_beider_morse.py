@@ -51,7 +51,7 @@ from ._beider_morse_data import (
     L_SPANISH,
     L_TURKISH,
 )
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['BeiderMorse']
 
@@ -932,6 +932,8 @@ class BeiderMorse(_Phonetic):
         self._filter_langs = filter_langs
         self._lang_choices = lang_choices
 
+    # BMPM encodings can run to hundreds of characters, so fewer are kept
+    @_cache_encode(4096)
     def encode(self, word: str) -> str:
         """Return the Beider-Morse Phonetic Matching encoding(s) of a term.
 
@@ -20,9 +20,8 @@ Daitch-Mokotoff Soundex
 """
 
 from typing import Dict, Tuple, Union, cast
-from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['DaitchMokotoff']
 
@@ -360,8 +359,8 @@ class DaitchMokotoff(_Phonetic):
         dms = ['']  # initialize empty code list
 
         # uppercase, normalize, decompose, and filter non-A-Z
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = _nfkd_upper(word)
+        word = word.translate(self._uc_trans)
 
         # Nothing to convert, return base case
         if not word:
@@ -19,9 +19,7 @@
 Dolby Code
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['Dolby']
 
@@ -162,8 +160,8 @@ class Dolby(_Phonetic):
 
         """
         # uppercase, normalize, decompose, and filter non-A-Z out
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = _nfkd_upper(word)
+        word = word.translate(self._uc_trans)
 
         # Rule 1 (FL2)
         if word[:3] in {'MCG', 'MAG', 'MAC'}:
@@ -19,7 +19,7 @@
 Eudex phonetic hash
 """
 
-from ._phonetic import _Phonetic
+from ._phonetic import _DeletionTable, _Phonetic, _cache_encode
 
 __all__ = ['Eudex']
 
@@ -159,6 +159,13 @@ class Eudex(_Phonetic):
         'ÿ': 0b11100101,  # ÿ
     }
 
+    # str.translate tables that drop unknown characters and, for the
+    # latter, map the rest to their trailing eudex values (as chr codes)
+    _known_trans = _DeletionTable((ord(_), _) for _ in _initial_phones)
+    _trailing_trans = _DeletionTable(
+        (ord(char), chr(val)) for char, val in _trailing_phones.items()
+    )
+
     def __init__(self, max_length: int = 8) -> None:
         """Initialize Eudex instance.
 
@@ -173,6 +180,7 @@ class Eudex(_Phonetic):
         """
         self._max_length = max_length
 
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the eudex phonetic hash of a word.
 
@@ -209,23 +217,22 @@ class Eudex(_Phonetic):
 
         """
         # Lowercase input & filter unknown characters
-        word = ''.join(
-            char for char in word.lower() if char in self._initial_phones
-        )
+        word = word.lower().translate(self._known_trans)
 
         if not word:
             word = '÷'
 
         # Perform initial eudex coding of each character
         values = [self._initial_phones[word[0]]]
-        values += [self._trailing_phones[char] for char in word[1:]]
+        values += word[1:].translate(self._trailing_trans).encode('latin-1')
 
         # Right-shift by one to determine if second instance should be skipped
-        shifted_values = [_ >> 1 for _ in values]
-        condensed_values = [values[0]]
-        for n in range(1, len(shifted_values)):
-            if shifted_values[n] != shifted_values[n - 1]:
-                condensed_values.append(values[n])
+        condensed_values = values[:1]
+        prev_shifted = values[0] >> 1
+        for val in values[1:]:
+            if val >> 1 != prev_shifted:
+                condensed_values.append(val)
+            prev_shifted = val >> 1
 
         # Add padding after first character & trim beyond max_length
         values = (
@@ -235,11 +242,7 @@ class Eudex(_Phonetic):
         )
 
         # Combine individual character values into eudex hash
-        hash_value = 0
-        for val in values:
-            hash_value = (hash_value << 8) | val
-
-        return str(hash_value)
+        return str(int.from_bytes(bytes(values), 'big'))
 
 
 if __name__ == '__main__':
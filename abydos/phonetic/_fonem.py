@@ -20,10 +20,11 @@ FONEM
 """
 
 from re import compile as re_compile
-from typing import Match, cast
+from sys import intern
+from typing import Any, Dict, Match, Optional, Tuple, cast
 from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _DeletionTable, _Phonetic, _cache_encode
 
 __all__ = ['FONEM']
 
@@ -32,6 +33,34 @@ def _get_parts(m: Match[str]) -> str:
     return (m.group(1) or '') + (m.group(2) or '')
 
 
+def _gate_rules(
+    order: Tuple[str, ...],
+    table: Dict[str, Tuple[Any, Any]],
+    gates: Dict[str, str],
+) -> Tuple[Tuple[Optional[str], Tuple[Any, Any]], ...]:
+    """Pair each rule, in order, with its gate.
+
+    Parameters
+    ----------
+    order : tuple of str
+        The names of the rules, in the order they are applied
+    table : dict
+        The rules (a literal or compiled regex & its replacement), by name
+    gates : dict
+        Substrings that a word must contain for a rule to apply, by rule name
+
+    Returns
+    -------
+    tuple
+        The (gate, rule) pairs, with None as the gate of ungated rules
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return tuple(zip(map(gates.get, order), map(table.__getitem__, order)))
+
+
 class FONEM(_Phonetic):
     """FONEM.
 
@@ -127,7 +156,9 @@ class FONEM(_Phonetic):
         'C-34': ('G#', 'GA'),
         'C-35': ('MA#', 'MAC'),
     }
-    _rule_order = (
+    # Vowel & consonant doubling rules, which are applied both before and
+    # after the main rules
+    _dedupe_order = (
         'V-14',
         'C-28',
         'C-28a',
@@ -135,6 +166,8 @@ class FONEM(_Phonetic):
         'C-28bb',
         'C-28c',
         'C-28d',
+    )
+    _main_order = (
         'C-12',
         'C-8',
         'C-9',
@@ -182,19 +215,106 @@ class FONEM(_Phonetic):
         'C-26',
         'C-27',
         'C-29',
-        'V-14',
-        'C-28',
-        'C-28a',
-        'C-28b',
-        'C-28bb',
-        'C-28c',
-        'C-28d',
-        'C-34',
-        'C-35',
     )
+    _final_order = ('C-34', 'C-35')
+
+    # Every match of a doubling rule contains a doubled letter or is ILE at
+    # the end of the word, so words without either can skip those rules
+    _dedupe_screen = re_compile(r'(.)\1|ILE$')
 
     _uc_set = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ-')
 
+    # A letter that every match of a regex rule contains, so that the rule
+    # can be skipped for words without it
+    _rule_gates = {
+        'V-1': 'U',
+        'V-2,5': 'L',
+        'V-3,4': 'U',
+        'V-6': 'D',
+        'V-7': 'Y',
+        'V-8': 'X',
+        'V-9': 'Y',
+        'V-11': 'I',
+        'V-12': 'L',
+        'V-13': 'U',
+        'V-15': 'M',
+        'V-16': 'M',
+        'V-17': 'N',
+        'V-18': 'I',
+        'V-19': 'B',
+        'V-20': 'M',
+        'C-2': 'C',
+        'C-3': 'C',
+        'C-4': 'C',
+        'C-5': 'C',
+        'C-6': 'C',
+        'C-7': 'C',
+        'C-8': 'C',
+        'C-9': 'C',
+        'C-10': 'G',
+        'C-11': 'G',
+        'C-12': 'G',
+        'C-13': 'G',
+        'C-14': 'H',
+        'C-16': 'M',
+        'C-17': 'M',
+        'C-20': 'C',
+        'C-21': 'C',
+        'C-22': 'C',
+        'C-24': 'T',
+        'C-25': 'W',
+        'C-26': 'X',
+        'C-27': 'Z',
+        'C-28a': 'C',
+        'C-28b': 'S',
+        'C-28bb': 'S',
+        'C-28c': 'L',
+        'C-28d': 'L',
+        'C-31,33': 'T',
+    }
+
+    # Keep A-Z & hyphens, expanding the ligatures, and delete everything else
+    _fr_trans = _DeletionTable((ord(_), _) for _ in _uc_set)
+    _fr_trans.update({198: 'AE', 338: 'OE'})
+
+    # The rules, in the order they are applied, with their gates
+    _dedupe_rules = _gate_rules(_dedupe_order, _rule_table, _rule_gates)
+    _main_rules = _gate_rules(_main_order, _rule_table, _rule_gates)
+    _final_rules = _gate_rules(_final_order, _rule_table, _rule_gates)
+
+    @staticmethod
+    def _apply_rules(
+        word: str,
+        rules: Tuple[Tuple[Optional[str], Tuple[Any, Any]], ...],
+    ) -> str:
+        """Apply gated rules to a word, in order.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+        rules : tuple
+            The (gate, rule) pairs, as returned by _gate_rules
+
+        Returns
+        -------
+        str
+            The word, after every rule whose gate it contains is applied
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for gate, (regex, repl) in rules:
+            if gate is not None and gate not in word:
+                continue
+            if isinstance(regex, str):
+                word = word.replace(regex, cast(str, repl))
+            else:
+                word = regex.sub(repl, word)
+        return word
+
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the FONEM code of a word.
 
@@ -230,17 +350,17 @@ class FONEM(_Phonetic):
         """
         # normalize, upper-case, and filter non-French letters
         word = unicode_normalize('NFKD', word.upper())
-        word = word.translate({198: 'AE', 338: 'OE'})
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = word.translate(self._fr_trans)
 
-        for rule in self._rule_order:
-            regex, repl = self._rule_table[rule]
-            if isinstance(regex, str):
-                word = word.replace(regex, cast(str, repl))
-            else:
-                word = regex.sub(repl, word)  # type: ignore
+        if self._dedupe_screen.search(word):
+            word = self._apply_rules(word, self._dedupe_rules)
+        word = self._apply_rules(word, self._main_rules)
+        if self._dedupe_screen.search(word):
+            word = self._apply_rules(word, self._dedupe_rules)
+        word = self._apply_rules(word, self._final_rules)
 
-        return word
+        # Codes repeat heavily across a corpus, so share one copy of each
+        return intern(word)
 
 
 if __name__ == '__main__':
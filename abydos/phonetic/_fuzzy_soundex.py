@@ -19,9 +19,7 @@
 Fuzzy Soundex
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['FuzzySoundex']
 
@@ -129,7 +127,7 @@ class FuzzySoundex(_Phonetic):
             Encapsulated in class
 
         """
-        word = unicode_normalize('NFKD', word.upper())
+        word = _nfkd_upper(word)
 
         if not word:
             if self._zero_pad:
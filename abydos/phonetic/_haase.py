@@ -20,14 +20,96 @@ Haase Phonetik
 """
 
 from itertools import product
-from typing import List, Set, Tuple, Union, cast
+from typing import Dict, List, Set, Tuple
 from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['Haase']
 
 
+class _HaaseCodes(Dict[Tuple[str, str, str], str]):
+    """Haase codes of letters in context, computed on first use.
+
+    Keys are (previous letter, letter, next letter) triples, with a space
+    standing in beyond either end of the word.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, vowels: Set[str]) -> None:
+        """Initialize _HaaseCodes instance.
+
+        Parameters
+        ----------
+        vowels : set
+            The letters coded as vowels
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super().__init__()
+        self._vowels = vowels
+
+    def __missing__(self, key: Tuple[str, str, str]) -> str:
+        """Compute, store, and return the Haase code of a letter in context.
+
+        Parameters
+        ----------
+        key : tuple
+            The previous letter, the letter, and the next letter
+
+        Returns
+        -------
+        str
+            The letter's Haase code
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        prev, char, nxt = key
+        if char in self._vowels:
+            code = '9'
+        elif char == 'B':
+            code = '1'
+        elif char == 'P':
+            code = '3' if nxt == 'H' else '1'
+        elif char in {'D', 'T'}:
+            code = '8' if nxt in {'C', 'S', 'Z'} else '2'
+        elif char in {'F', 'V', 'W'}:
+            code = '3'
+        elif char in {'G', 'K', 'Q'}:
+            code = '4'
+        elif char == 'C':
+            if prev in {'S', 'Z'}:
+                code = '8'
+            elif prev == ' ':
+                if nxt in {'A', 'H', 'K', 'L', 'O', 'Q', 'R', 'U', 'X'}:
+                    code = '4'
+                else:
+                    code = '8'
+            elif nxt in {'A', 'H', 'K', 'O', 'Q', 'U', 'X'}:
+                code = '4'
+            else:
+                code = '8'
+        elif char == 'X':
+            code = '8' if prev in {'C', 'K', 'Q'} else '48'
+        elif char == 'L':
+            code = '5'
+        elif char in {'M', 'N'}:
+            code = '6'
+        elif char == 'R':
+            code = '7'
+        elif char in {'S', 'Z'}:
+            code = '8'
+        else:
+            code = ''
+        self[key] = code
+        return code
+
+
 class Haase(_Phonetic):
     """Haase Phonetik.
 
@@ -42,6 +124,18 @@ class Haase(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '123456789'), 'PTFKLNRSA'))
 
+    _codes = _HaaseCodes(_uc_v_set)
+
+    # Three-letter sequences with an alternate spelling
+    _len_3_vars = {
+        'OWN': 'AUN',
+        'WSK': 'RSK',
+        'SCH': 'CH',
+        'GLI': 'LI',
+        'AUX': 'O',
+        'EUX': 'O',
+    }
+
     def __init__(self, primary_only: bool = False) -> None:
         """Initialize Haase instance.
 
@@ -91,6 +185,7 @@ class Haase(_Phonetic):
         """
         return self.encode(word).translate(self._alphabetic)
 
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the Haase Phonetik (numeric output) code for a word.
 
@@ -129,85 +224,29 @@ class Haase(_Phonetic):
 
         """
 
-        def _after(word: str, pos: int, letters: Set[str]) -> bool:
-            """Return True if word[pos] follows one of the supplied letters.
-
-            Parameters
-            ----------
-            word : str
-                Word to modify
-            pos : int
-                Position to examine
-            letters : set
-                Letters to check for
-
-            Returns
-            -------
-            bool
-                True if word[pos] follows one of letters
-
-            .. versionadded:: 0.3.0
-
-            """
-            if pos > 0 and word[pos - 1] in letters:
-                return True
-            return False
-
-        def _before(word: str, pos: int, letters: Set[str]) -> bool:
-            """Return True if word[pos] precedes one of the supplied letters.
-
-            Parameters
-            ----------
-            word : str
-                Word to modify
-            pos : int
-                Position to examine
-            letters : set
-                Letters to check for
-
-            Returns
-            -------
-            bool
-                True if word[pos] precedes one of letters
-
-            .. versionadded:: 0.3.0
-
-            """
-            if pos + 1 < len(word) and word[pos + 1] in letters:
-                return True
-            return False
-
         word = unicode_normalize('NFKD', word.upper())
 
         word = word.replace('Ä', 'AE')
         word = word.replace('Ö', 'OE')
         word = word.replace('Ü', 'UE')
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = word.translate(self._uc_trans)
 
-        variants = []  # type: List[Union[str, Tuple[str, ...]]]
+        variants = []  # type: List[Tuple[str, ...]]
         if self._primary_only:
-            variants = [word]
+            variants = [(word,)]
         else:
             pos = 0
             if word[:2] == 'CH':
                 variants.append(('CH', 'SCH'))
                 pos += 2
-            len_3_vars = {
-                'OWN': 'AUN',
-                'WSK': 'RSK',
-                'SCH': 'CH',
-                'GLI': 'LI',
-                'AUX': 'O',
-                'EUX': 'O',
-            }
+            len_3_vars = self._len_3_vars
             while pos < len(word):
                 if word[pos : pos + 4] == 'ILLE':
                     variants.append(('ILLE', 'I'))
                     pos += 4
                 elif word[pos : pos + 3] in len_3_vars:
-                    variants.append(
-                        (word[pos : pos + 3], len_3_vars[word[pos : pos + 3]])
-                    )
+                    trigram = word[pos : pos + 3]
+                    variants.append((trigram, len_3_vars[trigram]))
                     pos += 3
                 elif word[pos : pos + 2] == 'RB':
                     variants.append(('RB', 'RW'))
@@ -225,74 +264,21 @@ class Haase(_Phonetic):
                     variants.append((word[pos],))
                     pos += 1
 
-            variants = [''.join(letters) for letters in product(*variants)]
-
-        def _haase_code(word: str) -> str:
-            sdx = ''
-            for i in range(len(word)):
-                if word[i] in self._uc_v_set:
-                    sdx += '9'
-                elif word[i] == 'B':
-                    sdx += '1'
-                elif word[i] == 'P':
-                    if _before(word, i, {'H'}):
-                        sdx += '3'
-                    else:
-                        sdx += '1'
-                elif word[i] in {'D', 'T'}:
-                    if _before(word, i, {'C', 'S', 'Z'}):
-                        sdx += '8'
-                    else:
-                        sdx += '2'
-                elif word[i] in {'F', 'V', 'W'}:
-                    sdx += '3'
-                elif word[i] in {'G', 'K', 'Q'}:
-                    sdx += '4'
-                elif word[i] == 'C':
-                    if _after(word, i, {'S', 'Z'}):
-                        sdx += '8'
-                    elif i == 0:
-                        if _before(
-                            word,
-                            i,
-                            {'A', 'H', 'K', 'L', 'O', 'Q', 'R', 'U', 'X'},
-                        ):
-                            sdx += '4'
-                        else:
-                            sdx += '8'
-                    elif _before(word, i, {'A', 'H', 'K', 'O', 'Q', 'U', 'X'}):
-                        sdx += '4'
-                    else:
-                        sdx += '8'
-                elif word[i] == 'X':
-                    if _after(word, i, {'C', 'K', 'Q'}):
-                        sdx += '8'
-                    else:
-                        sdx += '48'
-                elif word[i] == 'L':
-                    sdx += '5'
-                elif word[i] in {'M', 'N'}:
-                    sdx += '6'
-                elif word[i] == 'R':
-                    sdx += '7'
-                elif word[i] in {'S', 'Z'}:
-                    sdx += '8'
-
-            sdx = self._delete_consecutive_repeats(sdx)
-
-            return sdx
-
-        encoded = [_haase_code(word) for word in cast(List[str], variants)]
-        if len(encoded) > 1:
-            encoded_set = set()  # type: Set[str]
-            encoded_single = []
-            for code in encoded:
-                if code not in encoded_set:
-                    encoded_set.add(code)
-                    encoded_single.append(code)
-            return ','.join(encoded_single)
-
-        return encoded[0]
+        # Code the variants as they are generated, keeping only the first
+        # instance of each code
+        codes = self._codes
+        encoded = []  # type: List[str]
+        encoded_set = set()  # type: Set[str]
+        for letters in product(*variants):
+            word = ''.join(letters)
+            contexts = zip(' ' + word, word, word[1:] + ' ')
+            code = ''.join(map(codes.__getitem__, contexts))
+            code = self._delete_consecutive_repeats(code)
+            if code not in encoded_set:
+                encoded_set.add(code)
+                encoded.append(code)
+
+        return ','.join(encoded)
 
 
 if __name__ == '__main__':
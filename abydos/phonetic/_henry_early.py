@@ -19,9 +19,7 @@
 an early version of Henry Code
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['HenryEarly']
 
@@ -94,8 +92,8 @@ class HenryEarly(_Phonetic):
             Encapsulated in class
 
         """
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = _nfkd_upper(word)
+        word = word.translate(self._uc_trans)
 
         if not word:
             return ''
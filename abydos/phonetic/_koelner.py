@@ -20,9 +20,8 @@ Kölner Phonetik
 """
 
 from typing import Set
-from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = [
     'Koelner',
@@ -127,12 +126,12 @@ class Koelner(_Phonetic):
 
         sdx = ''
 
-        word = unicode_normalize('NFKD', word.upper())
+        word = _nfkd_upper(word)
 
         word = word.replace('Ä', 'AE')
         word = word.replace('Ö', 'OE')
         word = word.replace('Ü', 'UE')
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = word.translate(self._uc_trans)
 
         # Nothing to convert, return base case
         if not word:
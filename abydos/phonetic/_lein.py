@@ -21,7 +21,7 @@ Michigan LEIN (Law Enforcement Information Network) encoding
 
 from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['LEIN']
 
@@ -35,11 +35,10 @@ class LEIN(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    _trans = dict(
-        zip((ord(_) for _ in 'BCDFGJKLMNPQRSTVXZ'), '451455532245351455')
-    )
+    # Rules 2 & 4 run on ASCII bytes, since only A-Z remain by then
+    _trans = bytes.maketrans(b'BCDFGJKLMNPQRSTVXZ', b'451455532245351455')
 
-    _del_trans = {num: None for num in (32, 65, 69, 72, 73, 79, 85, 87, 89)}
+    _del_chars = b' AEHIOUWY'
 
     _alphabetic = dict(zip((ord(_) for _ in '12345'), 'TNLPK'))
 
@@ -93,6 +92,7 @@ class LEIN(_Phonetic):
         code = self.encode(word).rstrip('0')
         return code[:1] + code[1:].translate(self._alphabetic)
 
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the LEIN code for a word.
 
@@ -126,12 +126,12 @@ class LEIN(_Phonetic):
         """
         # uppercase, normalize, decompose, and filter non-A-Z out
         word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = word.translate(self._uc_trans)
 
         code = word[:1]  # Rule 1
-        word = word[1:].translate(self._del_trans)  # Rule 2
-        word = self._delete_consecutive_repeats(word)  # Rule 3
-        code += word.translate(self._trans)  # Rule 4
+        rest = word[1:].encode().translate(None, self._del_chars)  # Rule 2
+        word = self._delete_consecutive_repeats(rest.decode())  # Rule 3
+        code += word.encode().translate(self._trans).decode()  # Rule 4
 
         if self._zero_pad:
             code += '0' * self._max_length  # Rule 4
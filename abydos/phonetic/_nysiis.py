@@ -20,7 +20,7 @@ New York State Identification and Intelligence System (NYSIIS) phonetic
 encoding
 """
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['NYSIIS']
 
@@ -58,6 +58,7 @@ class NYSIIS(_Phonetic):
 
         self._modified = modified
 
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the NYSIIS code for a word.
 
@@ -103,7 +104,7 @@ class NYSIIS(_Phonetic):
 
         """
 
-        word = ''.join(c for c in word.upper() if c.isalpha())
+        word = ''.join(filter(str.isalpha, word.upper()))
 
         # exit early if there are no alphas
         if not word:
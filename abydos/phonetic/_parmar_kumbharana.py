@@ -19,7 +19,12 @@
 Parmar-Kumbharana phonetic algorithm
 """
 
-from ._phonetic import _Phonetic
+from itertools import chain
+from re import compile as re_compile
+from sys import intern
+from typing import Match
+
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['ParmarKumbharana']
 
@@ -50,8 +55,34 @@ class ParmarKumbharana(_Phonetic):
             'SH': 'S',
         },
     }
-    _del_trans = {65: '', 69: '', 73: '', 79: '', 85: '', 89: ''}
+    # All of the rules as a single table, & as a regex of their patterns
+    # listed longest first, so that the longest match at each position wins
+    _rule_table = dict(chain.from_iterable(map(dict.items, _rules.values())))
+    _rule_regex = re_compile(
+        '|'.join(sorted(_rule_table, key=len, reverse=True))
+    )
+
+    _del_trans = str.maketrans('', '', 'AEIOUY')
+
+    def _replace_rule(self, match: Match[str]) -> str:
+        """Return the replacement for a rule's match.
+
+        Parameters
+        ----------
+        match : Match
+            A match of one of the rules
+
+        Returns
+        -------
+        str
+            The replacement for the matched pattern
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._rule_table[match.group()]
 
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the Parmar-Kumbharana encoding of a word.
 
@@ -88,20 +119,10 @@ class ParmarKumbharana(_Phonetic):
         word = word.upper()  # Rule 3
         word = self._delete_consecutive_repeats(word)  # Rule 4
 
-        # Rule 5
-        i = 0
-        while i < len(word):
-            for match_len in range(4, 1, -1):
-                if word[i : i + match_len] in self._rules[match_len]:
-                    repl = self._rules[match_len][word[i : i + match_len]]
-                    word = word[:i] + repl + word[i + match_len :]
-                    i += len(repl)
-                    break
-            else:
-                i += 1
+        word = self._rule_regex.sub(self._replace_rule, word)  # Rule 5
 
         word = word[:1] + word[1:].translate(self._del_trans)  # Rule 6
-        return word
+        return intern(word)
 
 
 if __name__ == '__main__':
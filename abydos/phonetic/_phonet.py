@@ -19,14 +19,980 @@
 phonet algorithm (a.k.a. Hannoveraner Phonetik), intended chiefly for German
 """
 
-from collections import Counter
-from typing import Counter as TCounter, Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
 
 __all__ = ['Phonet']
 
+# Anchor conditions of a parsed rule context, as bit flags
+_ANCHOR_NONE = 0  # no anchor: the rule applies anywhere
+_ANCHOR_SOW = 1  # the match must be at the start of a word
+_ANCHOR_NOT_SOW = 2  # the match must not be at the start of a word
+_ANCHOR_EOW = 4  # the match must be at the end of a word
+_ANCHOR_FAIL = _ANCHOR_SOW | _ANCHOR_NOT_SOW  # the rule can never apply
+
+_META_CHARS = '(-<^$'
+
+_PhonetContext = Tuple[Optional[int], bool, int, int, int]
+_PhonetContinuationContext = Tuple[Optional[int], int, int]
+_PhonetHashes = Tuple[
+    Dict[str, int],
+    Dict[str, int],
+    List[List[int]],
+    List[List[int]],
+]
+
+_PhonetRule = NamedTuple(
+    '_PhonetRule',
+    [
+        ('first', str),  # the first character of the pattern
+        ('stem', str),  # the literal characters following the first
+        # the stem past its first two characters (which the candidate lookup
+        # has already matched; see _index_by_lookahead)
+        ('stem_tail', str),
+        # the context following the stem, if it may itself be compared
+        # literally against the input by the main (resp. continuation) match
+        ('literal_tail', str),
+        ('continuation_literal_tail', str),
+        # the parsed context, as matched by the main match
+        ('mask', Optional[int]),
+        ('dash', bool),
+        ('minus', int),
+        ('priority', int),
+        ('anchor', int),
+        # the parsed context, as matched by the continuation match
+        ('continuation_priority', int),
+        ('continuation_anchor', int),
+        ('lt', bool),  # whether the pattern contains '<'
+        ('carets', bool),  # whether the pattern contains '^^'
+        ('replacements', Tuple[Optional[str], Optional[str]]),
+    ],
+)
+
+# For each character, the rules to check, indexed by the alphabet position of
+# the following character and then by the (up to) two characters that follow
+# it (see _index_by_lookahead)
+_PhonetLookahead = Dict[str, Tuple[_PhonetRule, ...]]
+_PhonetDispatch = Dict[str, Tuple[_PhonetLookahead, ...]]
+
+# The tables that drive the matcher for a rule table: the alphabet positions
+# of characters and the dispatch tables for phonet 1 and phonet 2
+_PhonetState = NamedTuple(
+    '_PhonetState',
+    [
+        ('alpha_pos', Dict[str, int]),
+        ('dispatch', Tuple[_PhonetDispatch, _PhonetDispatch]),
+    ],
+)
+
+
+def _parse_mask(rule: str) -> Tuple[Optional[int], str]:
+    """Parse the ``(...)`` letter class at the start of a rule context.
+
+    Parameters
+    ----------
+    rule : str
+        The remainder of a rule pattern
+
+    Returns
+    -------
+    tuple
+        A bitmask (keyed by ordinal) of the letters permitted by the class
+        (or None if the context does not begin with a class) and the
+        remainder of the context following the class
+
+    .. versionadded:: 0.6.0
+
+    """
+    if rule[:1] != '(':
+        return None, rule
+
+    mask = 0
+    for ch in rule[1:]:
+        if ch.isalpha():
+            mask |= 1 << ord(ch)
+    return mask, rule[rule.find(')') + 1 :] if ')' in rule else ''
+
+
+def _parse_context(rule: str) -> _PhonetContext:
+    """Parse the context that follows the literal stem of a phonet rule.
+
+    Parameters
+    ----------
+    rule : str
+        The remainder of a rule pattern, following its literal stem
+
+    Returns
+    -------
+    tuple
+        The class bitmask (see :py:func:`_parse_mask`), whether the context
+        begins with a '-' (blocking continuation rules), the number of '-'
+        characters to un-match, the rule priority, and the anchor flags
+
+    .. versionadded:: 0.6.0
+
+    """
+    mask, rule = _parse_mask(rule)
+
+    dash = rule[:1] == '-'
+    minus = len(rule) - len(rule.lstrip('-'))
+    rule = rule[minus:]
+
+    if rule[:1] == '<':
+        rule = rule[1:]
+
+    priority = 5
+    if rule[:1].isdigit():
+        priority = int(rule[0])
+        rule = rule[1:]
+
+    if rule[:2] == '^^':
+        rule = rule[1:]
+
+    if not rule:
+        anchor = _ANCHOR_NONE
+    elif rule[0] == '^':
+        anchor = _ANCHOR_SOW
+        if rule[1:2] == '$':
+            anchor |= _ANCHOR_EOW
+    elif rule[0] == '$':
+        anchor = _ANCHOR_NOT_SOW | _ANCHOR_EOW
+    else:
+        anchor = _ANCHOR_FAIL
+
+    return mask, dash, minus, priority, anchor
+
+
+def _parse_continuation_context(rule: str) -> _PhonetContinuationContext:
+    """Parse the context of a phonet rule, as read for a continuation rule.
+
+    A continuation rule ignores '-' and '<' and may only be anchored at the
+    end of a word.
+
+    Parameters
+    ----------
+    rule : str
+        The remainder of a rule pattern, following its literal stem
+
+    Returns
+    -------
+    tuple
+        The class bitmask (see :py:func:`_parse_mask`), the rule priority,
+        and the anchor flags
+
+    .. versionadded:: 0.6.0
+
+    """
+    mask, rule = _parse_mask(rule)
+
+    rule = rule.lstrip('-')
+
+    if rule[:1] == '<':
+        rule = rule[1:]
+
+    priority = 5
+    if rule[:1].isdigit():
+        priority = int(rule[0])
+        rule = rule[1:]
+
+    if not rule:
+        anchor = _ANCHOR_NONE
+    elif rule[0] == '$':
+        anchor = _ANCHOR_EOW
+    else:
+        anchor = _ANCHOR_FAIL
+
+    return mask, priority, anchor
+
+
+def _parse_rule(
+    rule: Optional[str],
+    replacement_1: Optional[str],
+    replacement_2: Optional[str],
+) -> Optional[_PhonetRule]:
+    """Parse a phonet rule.
+
+    Parameters
+    ----------
+    rule : str or None
+        A rule pattern
+    replacement_1 : str or None
+        The rule's replacement for phonet 1
+    replacement_2 : str or None
+        The rule's replacement for phonet 2
+
+    Returns
+    -------
+    _PhonetRule or None
+        The parsed rule
+
+    .. versionadded:: 0.6.0
+
+    """
+    if not rule:
+        return None
+
+    stem_end = 1
+    while (
+        stem_end < len(rule)
+        and not rule[stem_end].isdigit()
+        and rule[stem_end] not in _META_CHARS
+    ):
+        stem_end += 1
+    tail = rule[stem_end:]
+
+    # The main match only stops comparing before a meta character if what
+    # remains of the pattern is itself a substring of _META_CHARS, and the
+    # continuation match only stops before a digit, so other tails may
+    # continue to be compared literally against the input.
+    if not tail or tail[0].isdigit():
+        literal_tail = continuation_literal_tail = ''
+    else:
+        literal_tail = '' if tail in _META_CHARS else tail
+        continuation_literal_tail = tail
+
+    _, continuation_priority, continuation_anchor = (
+        _parse_continuation_context(tail)
+    )
+
+    return _PhonetRule(
+        rule[0],
+        rule[1:stem_end],
+        rule[3:stem_end],
+        literal_tail,
+        continuation_literal_tail,
+        *_parse_context(tail),
+        continuation_priority,
+        continuation_anchor,
+        '<' in rule[1:],
+        '^^' in rule[1:],
+        (replacement_1, replacement_2),
+    )
+
+
+def _parse_rules(
+    rules: Tuple[Optional[str], ...],
+) -> Tuple[Optional[_PhonetRule], ...]:
+    """Parse a phonet rule table.
+
+    Parameters
+    ----------
+    rules : tuple
+        A rule table, consisting of a pattern followed by its phonet 1 and
+        phonet 2 replacements for each rule
+
+    Returns
+    -------
+    tuple
+        The parsed rules, aligned with the positions of their patterns in the
+        rule table
+
+    .. versionadded:: 0.6.0
+
+    """
+    return tuple(
+        _parse_rule(*rules[i : i + 3]) if i % 3 == 0 else None
+        for i in range(len(rules))
+    )
+
+
+def _initialize_phonet(rules: Tuple[Optional[str], ...]) -> _PhonetHashes:
+    """Initialize the phonet hash tables for a rule table.
+
+    Parameters
+    ----------
+    rules : tuple
+        A rule table
+
+    Returns
+    -------
+    tuple
+        The first-character hash, the alphabet positions, and the start and
+        end hashes of rules by their first two characters
+
+    .. versionadded:: 0.1.0
+    .. versionchanged:: 0.6.0
+        Moved to module level and computed once per rule table
+
+    """
+    phonet_hash = {}  # type: Dict[str, int]
+    alpha_pos = {}  # type: Dict[str, int]
+
+    # indexed by the alphabet positions of a rule's first two characters
+    phonet_hash_1 = [[-1] * 28 for _ in range(26)]
+    phonet_hash_2 = [[-1] * 28 for _ in range(26)]
+
+    phonet_hash[''] = -1
+
+    # German and international umlauts
+    for ch in {
+        'À',
+        'Á',
+        'Â',
+        'Ã',
+        'Ä',
+        'Å',
+        'Æ',
+        'Ç',
+        'È',
+        'É',
+        'Ê',
+        'Ë',
+        'Ì',
+        'Í',
+        'Î',
+        'Ï',
+        'Ð',
+        'Ñ',
+        'Ò',
+        'Ó',
+        'Ô',
+        'Õ',
+        'Ö',
+        'Ø',
+        'Ù',
+        'Ú',
+        'Û',
+        'Ü',
+        'Ý',
+        'Þ',
+        'ß',
+        'Œ',
+        'Š',
+        'Ÿ',
+    }:
+        alpha_pos[ch] = 1
+        phonet_hash[ch] = -1
+
+    # "normal" letters ('A'-'Z')
+    for i, ch in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+        alpha_pos[ch] = i + 2
+        phonet_hash[ch] = -1
+
+    # for each phonetc rule
+    for i in range(len(rules)):
+        rule = rules[i]
+
+        if rule and i % 3 == 0:
+            # calculate first hash value
+            ch = cast(str, rules[i])[0]
+
+            if phonet_hash.get(ch, 0) < 0 and (
+                cast(str, rules[i + 1]) or cast(str, rules[i + 2])
+            ):
+                phonet_hash[ch] = i
+
+            # calculate second hash values
+            if ch and alpha_pos.get(ch, 0) >= 2:
+                k = alpha_pos[ch]
+
+                j = k - 2
+                rule = rule[1:]
+
+                if not rule:
+                    rule = ' '
+                elif rule[0] == '(':
+                    rule = rule[1:]
+                else:
+                    rule = rule[0]
+
+                while rule and (rule[0] != ')'):
+                    k = alpha_pos.get(rule[0], 0)
+
+                    if k > 0:
+                        # add hash value for this letter
+                        if phonet_hash_1[j][k] < 0:
+                            phonet_hash_1[j][k] = i
+                            phonet_hash_2[j][k] = i
+
+                        if phonet_hash_2[j][k] >= (i - 30):
+                            phonet_hash_2[j][k] = i
+                        else:
+                            k = -1
+
+                    if k <= 0:
+                        # add hash value for all letters
+                        if phonet_hash_1[j][0] < 0:
+                            phonet_hash_1[j][0] = i
+
+                        phonet_hash_2[j][0] = i
+
+                    rule = rule[1:]
+
+    return phonet_hash, alpha_pos, phonet_hash_1, phonet_hash_2
+
+
+def _rule_ranges(
+    hashes: _PhonetHashes, char: str, next_pos: int
+) -> Tuple[int, int, int, int]:
+    """Return the ranges of rules to check for a character.
+
+    Parameters
+    ----------
+    hashes : tuple
+        The hash tables of a rule table (see :py:func:`_initialize_phonet`)
+    char : str
+        The character to check rules for
+    next_pos : int
+        The alphabet position of the character that follows it
+
+    Returns
+    -------
+    tuple
+        The start and end of the first range and of the second range of
+        rules; a second range is only used if its start is positive
+
+    .. versionadded:: 0.6.0
+
+    """
+    phonet_hash, alpha_pos, phonet_hash_1, phonet_hash_2 = hashes
+
+    xpos = alpha_pos.get(char, 0) - 2
+    if xpos < 0:
+        return phonet_hash.get(char, 0), 10000, -1, -1
+
+    start1 = phonet_hash_1[xpos][next_pos]
+    start2 = phonet_hash_1[xpos][0]
+    end1 = phonet_hash_2[xpos][next_pos]
+    end2 = phonet_hash_2[xpos][0]
+
+    # preserve rule priorities
+    if (start2 >= 0) and ((start1 < 0) or (start2 < start1)):
+        start1, start2 = start2, start1
+        end1, end2 = end2, end1
+
+    if (end1 >= start2) and (start2 >= 0):
+        if end2 > end1:
+            end1 = end2
+
+        start2 = -1
+        end2 = -1
+
+    return start1, end1, start2, end2
+
+
+def _rule_walk(
+    rules: Tuple[Optional[str], ...],
+    char: str,
+    start1: int,
+    end1: int,
+    start2: int,
+    end2: int,
+) -> Tuple[int, ...]:
+    """Return the positions of the rules checked for a character, in order.
+
+    Parameters
+    ----------
+    rules : tuple
+        A rule table
+    char : str
+        The character to check rules for
+    start1 : int
+        The start of the first range of rules
+    end1 : int
+        The end of the first range of rules
+    start2 : int
+        The start of the second range of rules
+    end2 : int
+        The end of the second range of rules
+
+    Returns
+    -------
+    tuple
+        The positions of the rule patterns to check
+
+    .. versionadded:: 0.6.0
+
+    """
+    positions = []
+    pos = start1
+
+    if pos >= 0:
+        while (rules[pos] is None) or (cast(str, rules[pos])[0] == char):
+            if pos > end1:
+                if start2 > 0:
+                    pos = start2
+                    start2 = -1
+                    end1 = end2
+                    end2 = -1
+                    continue
+
+                break
+
+            if rules[pos] is not None:
+                positions.append(pos)
+
+            pos += 3
+
+            if pos > end1 and start2 > 0:
+                pos = start2
+                end1 = end2
+                start2 = -1
+                end2 = -1
+
+    return tuple(positions)
+
+
+def _index_by_lookahead(
+    candidates: Tuple[_PhonetRule, ...],
+) -> _PhonetLookahead:
+    """Index the candidate rules by the characters that must follow them.
+
+    A rule can only match if the characters following its first character
+    begin with the first two characters of its stem. For each prefix of a
+    stem of up to two characters (and for the empty prefix), this keeps
+    only the rules that can match after it, in their original order. A
+    lookahead of the two characters following the current character is
+    then looked up in full, then by its first character, then as ''; the
+    first key found holds exactly the rules that can match.
+
+    Parameters
+    ----------
+    candidates : tuple
+        The rules to check, in order
+
+    Returns
+    -------
+    dict
+        The rules that can match, in order, keyed by lookahead
+
+    .. versionadded:: 0.6.0
+
+    """
+    keys = {''}
+    for rule in candidates:
+        keys.add(rule.stem[:1])
+        keys.add(rule.stem[:2])
+    return {
+        key: tuple(
+            rule for rule in candidates if key.startswith(rule.stem[:2])
+        )
+        for key in keys
+    }
+
+
+def _build_dispatch(
+    rules: Tuple[Optional[str], ...],
+    parsed_rules: Tuple[Optional[_PhonetRule], ...],
+    hashes: _PhonetHashes,
+    mode: int,
+) -> _PhonetDispatch:
+    """Build the table of rules to check for each pair of characters.
+
+    Which rules are checked at a position of a word depends only on its
+    character and on the alphabet position of the character that follows it,
+    so every walk over the rule table that phonet's hash tables describe is
+    taken once, here. Rules without a replacement for the phonet variant are
+    never applied, so they are left out.
+
+    Parameters
+    ----------
+    rules : tuple
+        A rule table
+    parsed_rules : tuple
+        The parsed rule table (see :py:func:`_parse_rules`)
+    hashes : tuple
+        The hash tables of the rule table (see :py:func:`_initialize_phonet`)
+    mode : int
+        The ponet variant to employ (1 or 2)
+
+    Returns
+    -------
+    dict
+        For each character that may begin a rule, the parsed rules to check,
+        in order, indexed by the alphabet position of the following character
+        and then by lookahead (see :py:func:`_index_by_lookahead`)
+
+    .. versionadded:: 0.6.0
+
+    """
+    chars = set(hashes[1]) | {rule[0] for rule in rules[::3] if rule}
+    return {
+        char: tuple(
+            _index_by_lookahead(
+                tuple(
+                    cast(_PhonetRule, parsed_rules[pos])
+                    for pos in _rule_walk(
+                        rules, char, *_rule_ranges(hashes, char, next_pos)
+                    )
+                    if rules[pos + mode] is not None
+                )
+            )
+            for next_pos in range(28)
+        )
+        for char in chars
+    }
+
+
+def _translation_table(from_chars: str, to_chars: str) -> str:
+    """Return a str.translate table as a string indexed by ordinal.
+
+    str.translate reads a string table faster than a dict, and leaves
+    characters beyond the end of the table unchanged.
+
+    Parameters
+    ----------
+    from_chars : str
+        The characters to translate
+    to_chars : str
+        Their translations
+
+    Returns
+    -------
+    str
+        The translation table
+
+    .. versionadded:: 0.6.0
+
+    """
+    table = [chr(i) for i in range(max(map(ord, from_chars)) + 1)]
+    for from_char, to_char in zip(from_chars, to_chars):
+        table[ord(from_char)] = to_char
+    return ''.join(table)
+
+
+def _compile_phonet(rules: Tuple[Optional[str], ...]) -> _PhonetState:
+    """Compile the matcher state of a phonet rule table.
+
+    Parameters
+    ----------
+    rules : tuple
+        A rule table
+
+    Returns
+    -------
+    _PhonetState
+        The alphabet positions and the dispatch tables for each phonet
+        variant
+
+    .. versionadded:: 0.6.0
+
+    """
+    parsed_rules = _parse_rules(rules)
+    hashes = _initialize_phonet(rules)
+    return _PhonetState(
+        hashes[1],
+        (
+            _build_dispatch(rules, parsed_rules, hashes, 1),
+            _build_dispatch(rules, parsed_rules, hashes, 2),
+        ),
+    )
+
+
+def _candidate_rules(
+    src: str, i: int, dispatch: _PhonetDispatch, alpha_pos: Dict[str, int]
+) -> Tuple[_PhonetRule, ...]:
+    """Return the rules to check at a position of a term, in order.
+
+    Parameters
+    ----------
+    src : str
+        The (upper-cased) term
+    i : int
+        The position in the term
+    dispatch : dict
+        The rules to check for each pair of characters (see
+        :py:func:`_build_dispatch`)
+    alpha_pos : dict
+        The alphabet positions of characters (see
+        :py:func:`_initialize_phonet`)
+
+    Returns
+    -------
+    tuple
+        The rules that may match at the position
+
+    .. versionadded:: 0.6.0
+
+    """
+    lookahead_index = dispatch.get(src[i])
+    if lookahead_index is None:
+        return ()
+
+    lookahead = src[i + 1 : i + 3]
+    by_lookahead = lookahead_index[alpha_pos.get(lookahead[:1], 0)]
+    candidates = by_lookahead.get(lookahead)
+    if candidates is None:
+        candidates = by_lookahead.get(lookahead[:1])
+        if candidates is None:
+            candidates = by_lookahead['']
+    return candidates
+
+
+def _is_word_end(src: str, pos: int) -> bool:
+    """Return whether a position of a term is past the end of a word.
+
+    Parameters
+    ----------
+    src : str
+        The (upper-cased) term
+    pos : int
+        The position following a match
+
+    Returns
+    -------
+    bool
+        True if the term ends before the position or the character there is
+        neither a letter nor '.'
+
+    .. versionadded:: 0.6.0
+
+    """
+    return pos >= len(src) or not (src[pos].isalpha() or src[pos] == '.')
+
+
+def _phonet(
+    term: str,
+    mode: int,
+    dispatch: _PhonetDispatch,
+    alpha_pos: Dict[str, int],
+    upper_trans: str,
+) -> str:
+    """Return the phonet coded form of a term.
+
+    All of the tables that drive the match are passed in explicitly, so that
+    this depends on no instance or enclosing state.
+
+    Parameters
+    ----------
+    term : str
+        Term to transform
+    mode : int
+        The ponet variant to employ (1 or 2)
+    dispatch : dict
+        The rules to check for each pair of characters, for the phonet
+        variant (see :py:func:`_build_dispatch`)
+    alpha_pos : dict
+        The alphabet positions of characters (see
+        :py:func:`_initialize_phonet`)
+    upper_trans : str
+        The translation table used to convert the term to upper-case
+
+    Returns
+    -------
+    str
+        The phonet value
+
+    .. versionadded:: 0.1.0
+    .. versionchanged:: 0.6.0
+        Moved to module level
+
+    """
+    dest = []  # type: List[str]
+
+    if not term:
+        return ''
+
+    # convert input string to upper-case
+    src = term.translate(upper_trans)
+
+    # check "src"
+    i = 0
+    zeta = 0
+
+    while i < len(src):
+        char = src[i]
+
+        zeta0 = 0
+
+        # the anchor that a match at this position can't satisfy
+        if (i == 0) or not src[i - 1].isalpha():
+            sow_conflict = _ANCHOR_NOT_SOW
+        else:
+            sow_conflict = _ANCHOR_SOW
+
+        # check rules for this char
+        for parsed in _candidate_rules(src, i, dispatch, alpha_pos):
+            # check whole string
+            mask = parsed.mask
+            dash = parsed.dash
+            minus = parsed.minus
+            priority = parsed.priority
+            anchor = parsed.anchor
+            matches = 1 + len(parsed.stem)
+
+            if parsed.stem_tail and not src.startswith(
+                parsed.stem_tail, i + 3
+            ):
+                anchor = _ANCHOR_FAIL
+            else:
+                literal_tail = parsed.literal_tail
+                if literal_tail:
+                    k = 0
+                    while (
+                        literal_tail[k:]
+                        and (len(src) > (i + matches))
+                        and (src[i + matches] == literal_tail[k])
+                        and not literal_tail[k].isdigit()
+                        and (literal_tail[k:] not in _META_CHARS)
+                    ):
+                        matches += 1
+                        k += 1
+                    if k:
+                        (
+                            mask,
+                            dash,
+                            minus,
+                            priority,
+                            anchor,
+                        ) = _parse_context(literal_tail[k:])
+
+                if mask is not None:
+                    # check an array of letters
+                    if (len(src) > (i + matches)) and (
+                        (mask >> ord(src[i + matches])) & 1
+                    ):
+                        matches += 1
+                    else:
+                        anchor = _ANCHOR_FAIL
+
+            matches0 = matches
+
+            if minus >= matches:
+                anchor = _ANCHOR_FAIL
+            else:
+                matches -= minus
+
+            applies = not (anchor & sow_conflict) and (
+                not (anchor & _ANCHOR_EOW) or _is_word_end(src, i + matches0)
+            )
+
+            if applies:
+                # look for continuation, if:
+                # matches > 1 und NO '-' in first string */
+                continuation = False
+
+                if (matches > 1) and (len(src) > (i + matches)) and not dash:
+                    # check continuation rules for src[i+matches]
+                    for parsed0 in _candidate_rules(
+                        src, i + matches - 1, dispatch, alpha_pos
+                    ):
+                        # check whole string
+                        mask0 = parsed0.mask
+                        priority0 = parsed0.continuation_priority
+                        anchor0 = parsed0.continuation_anchor
+                        matches0 = matches + len(parsed0.stem)
+
+                        if parsed0.stem_tail and not src.startswith(
+                            parsed0.stem_tail, i + matches + 2
+                        ):
+                            anchor0 = _ANCHOR_FAIL
+                        else:
+                            literal_tail = parsed0.continuation_literal_tail
+                            if literal_tail:
+                                k = 0
+                                while (
+                                    literal_tail[k:]
+                                    and (len(src) > (i + matches0))
+                                    and (src[i + matches0] == literal_tail[k])
+                                    and not literal_tail[k].isdigit()
+                                ):
+                                    matches0 += 1
+                                    k += 1
+                                if k:
+                                    (
+                                        mask0,
+                                        priority0,
+                                        anchor0,
+                                    ) = _parse_continuation_context(
+                                        literal_tail[k:]
+                                    )
+
+                            if mask0 is not None:
+                                # check an array of letters (a mask only
+                                # ever holds letters)
+                                if (len(src) > (i + matches0)) and (
+                                    (mask0 >> ord(src[i + matches0])) & 1
+                                ):
+                                    matches0 += 1
+                                else:
+                                    anchor0 = _ANCHOR_FAIL
+
+                        if anchor0 == _ANCHOR_NONE or (
+                            anchor0 == _ANCHOR_EOW
+                            and _is_word_end(src, i + matches0)
+                        ):
+                            if matches0 == matches:
+                                # this is only a partial string
+                                continue
+
+                            if priority0 < priority:
+                                # priority is too low
+                                continue
+
+                            # continuation rule found
+                            continuation = True
+                            break
+
+                if continuation:
+                    continue
+
+                # replace string
+                if parsed.lt:
+                    priority0 = 1
+                else:
+                    priority0 = 0
+
+                rule = cast(str, parsed.replacements[mode - 1])
+
+                if (priority0 == 1) and (zeta == 0):
+                    # rule with '<' is applied
+                    if (
+                        dest
+                        and rule
+                        and ((dest[-1] == char) or (dest[-1] == rule[0]))
+                    ):
+                        dest.pop()
+
+                    zeta0 = 1
+                    zeta += 1
+
+                    # no '<' rule's replacement is longer than its match
+                    src = src[:i] + rule + src[i + matches :]
+
+                    char = src[i]
+                else:
+                    i = i + matches - 1
+                    zeta = 0
+
+                    for ch in rule[:-1]:
+                        if not dest or (dest[-1] != ch):
+                            dest.append(ch)
+
+                    # new "current char"
+                    char = rule[-1:]
+
+                    if parsed.carets:
+                        if char:
+                            dest.append(char)
+
+                        src = src[i + 1 :]
+                        i = 0
+                        zeta0 = 1
+
+                break
+
+        if zeta0 == 0:
+            if char and (not dest or (dest[-1] != char)):
+                # delete multiple letters only
+                dest.append(char)
+
+            i += 1
+            zeta = 0
+
+    return ''.join(dest)
+
 
 class Phonet(_Phonetic):
     """Phonet code.
@@ -1051,16 +2017,9 @@ class Phonet(_Phonetic):
         # fmt: on
     )  # type: Tuple[Optional[str], ...]
 
-    _upper_trans = dict(
-        zip(
-            (
-                ord(_)
-                for _ in 'abcdefghijklmnopqrstuvwxyzàáâãåäæ'
-                + 'çðèéêëìíîïñòóôõöøœšßþùúûüýÿ'
-            ),
-            'ABCDEFGHIJKLMNOPQRSTUVWXYZÀÁÂÃÅÄÆ'
-            + 'ÇÐÈÉÊËÌÍÎÏÑÒÓÔÕÖØŒŠßÞÙÚÛÜÝŸ',
-        )
+    _upper_trans = _translation_table(
+        'abcdefghijklmnopqrstuvwxyzàáâãåäæçðèéêëìíîïñòóôõöøœšßþùúûüýÿ',
+        'ABCDEFGHIJKLMNOPQRSTUVWXYZÀÁÂÃÅÄÆÇÐÈÉÊËÌÍÎÏÑÒÓÔÕÖØŒŠßÞÙÚÛÜÝŸ',
     )
 
     def __init__(self, mode: int = 1, lang: str = 'de') -> None:
@@ -1075,8 +2034,12 @@ class Phonet(_Phonetic):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Raises a ValueError if mode is not 1 or 2
 
         """
+        if mode not in {1, 2}:
+            raise ValueError('Unknown mode {}; must be 1 or 2'.format(mode))
         self._mode = mode
         self._lang = lang
 
@@ -1131,612 +2094,66 @@ class Phonet(_Phonetic):
             Encapsulated in class
 
         """
-        phonet_hash = Counter()  # type: TCounter[str]
-        alpha_pos = Counter()  # type: TCounter[str]
-
-        phonet_hash_1 = Counter()  # type: TCounter[Tuple[int, int]]
-        phonet_hash_2 = Counter()  # type: TCounter[Tuple[int, int]]
-
-        def _initialize_phonet(lang: str) -> None:
-            """Initialize phonet variables.
-
-            Parameters
-            ----------
-            lang : str
-                Language to use for rules
-
-            .. versionadded:: 0.1.0
-
-            """
-            if lang == 'none':
-                _phonet_rules = self._rules_no_lang
-            else:
-                _phonet_rules = self._rules_german
-
-            phonet_hash[''] = -1
-
-            # German and international umlauts
-            for ch in {
-                'À',
-                'Á',
-                'Â',
-                'Ã',
-                'Ä',
-                'Å',
-                'Æ',
-                'Ç',
-                'È',
-                'É',
-                'Ê',
-                'Ë',
-                'Ì',
-                'Í',
-                'Î',
-                'Ï',
-                'Ð',
-                'Ñ',
-                'Ò',
-                'Ó',
-                'Ô',
-                'Õ',
-                'Ö',
-                'Ø',
-                'Ù',
-                'Ú',
-                'Û',
-                'Ü',
-                'Ý',
-                'Þ',
-                'ß',
-                'Œ',
-                'Š',
-                'Ÿ',
-            }:
-                alpha_pos[ch] = 1
-                phonet_hash[ch] = -1
-
-            # "normal" letters ('A'-'Z')
-            for i, ch in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
-                alpha_pos[ch] = i + 2
-                phonet_hash[ch] = -1
-
-            for i in range(26):
-                for j in range(28):
-                    phonet_hash_1[i, j] = -1
-                    phonet_hash_2[i, j] = -1
-
-            # for each phonetc rule
-            for i in range(len(_phonet_rules)):
-                rule = _phonet_rules[i]
-
-                if rule and i % 3 == 0:
-                    # calculate first hash value
-                    ch = cast(str, _phonet_rules[i])[0]
-
-                    if phonet_hash[ch] < 0 and (
-                        cast(str, _phonet_rules[i + 1])
-                        or cast(str, _phonet_rules[i + 2])
-                    ):
-                        phonet_hash[ch] = i
-
-                    # calculate second hash values
-                    if ch and alpha_pos[ch] >= 2:
-                        k = alpha_pos[ch]
-
-                        j = k - 2
-                        rule = rule[1:]
-
-                        if not rule:
-                            rule = ' '
-                        elif rule[0] == '(':
-                            rule = rule[1:]
-                        else:
-                            rule = rule[0]
-
-                        while rule and (rule[0] != ')'):
-                            k = alpha_pos[rule[0]]
-
-                            if k > 0:
-                                # add hash value for this letter
-                                if phonet_hash_1[j, k] < 0:
-                                    phonet_hash_1[j, k] = i
-                                    phonet_hash_2[j, k] = i
 
-                                if phonet_hash_2[j, k] >= (i - 30):
-                                    phonet_hash_2[j, k] = i
-                                else:
-                                    k = -1
-
-                            if k <= 0:
-                                # add hash value for all letters
-                                if phonet_hash_1[j, 0] < 0:
-                                    phonet_hash_1[j, 0] = i
-
-                                phonet_hash_2[j, 0] = i
-
-                            rule = rule[1:]
-
-        def _phonet(term: str, mode: int, lang: str) -> str:
-            """Return the phonet coded form of a term.
-
-            Parameters
-            ----------
-            term : str
-                Term to transform
-            mode : int
-                The ponet variant to employ (1 or 2)
-            lang : str
-                ``de`` (default) for German, ``none`` for no language
-
-            Returns
-            -------
-            str
-                The phonet value
-
-            .. versionadded:: 0.1.0
-
-            """
-            if lang == 'none':
-                _phonet_rules = self._rules_no_lang
-            else:
-                _phonet_rules = self._rules_german
-
-            char0 = ''
-            dest = term
-
-            if not term:
-                return ''
-
-            term_length = len(term)
-
-            # convert input string to upper-case
-            src = term.translate(self._upper_trans)
-
-            # check "src"
-            i = 0
-            j = 0
-            zeta = 0
-
-            while i < len(src):
-                char = src[i]
-
-                pos = alpha_pos[char]
-
-                if pos >= 2:
-                    xpos = pos - 2
-
-                    if i + 1 == len(src):
-                        pos = alpha_pos['']
-                    else:
-                        pos = alpha_pos[src[i + 1]]
-
-                    start1 = phonet_hash_1[xpos, pos]
-                    start2 = phonet_hash_1[xpos, 0]
-                    end1 = phonet_hash_2[xpos, pos]
-                    end2 = phonet_hash_2[xpos, 0]
-
-                    # preserve rule priorities
-                    if (start2 >= 0) and ((start1 < 0) or (start2 < start1)):
-                        pos = start1
-                        start1 = start2
-                        start2 = pos
-                        pos = end1
-                        end1 = end2
-                        end2 = pos
-
-                    if (end1 >= start2) and (start2 >= 0):
-                        if end2 > end1:
-                            end1 = end2
-
-                        start2 = -1
-                        end2 = -1
-                else:
-                    pos = phonet_hash[char]
-                    start1 = pos
-                    end1 = 10000
-                    start2 = -1
-                    end2 = -1
-
-                pos = start1
-                zeta0 = 0
-
-                if pos >= 0:
-                    # check rules for this char
-                    while (_phonet_rules[pos] is None) or (
-                        cast(str, _phonet_rules[pos])[0] == char
-                    ):
-                        if pos > end1:
-                            if start2 > 0:
-                                pos = start2
-                                start1 = start2
-                                start2 = -1
-                                end1 = end2
-                                end2 = -1
-                                continue
-
-                            break
-
-                        if (_phonet_rules[pos] is None) or (
-                            _phonet_rules[pos + mode] is None
-                        ):
-                            # no conversion rule available
-                            pos += 3
-                            continue
-
-                        # check whole string
-                        matches = 1  # number of matching letters
-                        priority = 5  # default priority
-                        rule = cast(str, _phonet_rules[pos])[1:]
-
-                        while (
-                            rule
-                            and (len(src) > (i + matches))
-                            and (src[i + matches] == rule[0])
-                            and not rule[0].isdigit()
-                            and (rule not in '(-<^$')
-                        ):
-                            matches += 1
-                            rule = rule[1:]
-
-                        if rule and (rule[0] == '('):
-                            # check an array of letters
-                            if (
-                                (len(src) > (i + matches))
-                                and src[i + matches].isalpha()
-                                and (src[i + matches] in rule[1:])
-                            ):
-                                matches += 1
-
-                                while rule and rule[0] != ')':
-                                    rule = rule[1:]
-
-                                # if rule[0] == ')':
-                                rule = rule[1:]
-
-                        if rule:
-                            priority0 = ord(rule[0])
-                        else:
-                            priority0 = 0
-
-                        matches0 = matches
-
-                        while rule and rule[0] == '-' and matches > 1:
-                            matches -= 1
-                            rule = rule[1:]
-
-                        if rule and rule[0] == '<':
-                            rule = rule[1:]
-
-                        if rule and rule[0].isdigit():
-                            # read priority
-                            priority = int(rule[0])
-                            rule = rule[1:]
-
-                        if rule and rule[0:2] == '^^':
-                            rule = rule[1:]
-
-                        if (
-                            not rule
-                            or (
-                                (rule[0] == '^')
-                                and ((i == 0) or not src[i - 1].isalpha())
-                                and (
-                                    (rule[1:2] != '$')
-                                    or (
-                                        not (
-                                            src[
-                                                i + matches0 : i + matches0 + 1
-                                            ].isalpha()
-                                        )
-                                        and (
-                                            src[
-                                                i + matches0 : i + matches0 + 1
-                                            ]
-                                            != '.'
-                                        )
-                                    )
-                                )
-                            )
-                            or (
-                                (rule[0] == '$')
-                                and (i > 0)
-                                and src[i - 1].isalpha()
-                                and (
-                                    (
-                                        not src[
-                                            i + matches0 : i + matches0 + 1
-                                        ].isalpha()
-                                    )
-                                    and (
-                                        src[i + matches0 : i + matches0 + 1]
-                                        != '.'
-                                    )
-                                )
-                            )
-                        ):
-                            # look for continuation, if:
-                            # matches > 1 und NO '-' in first string */
-                            pos0 = -1
-
-                            start3 = 0
-                            start4 = 0
-                            end3 = 0
-                            end4 = 0
-
-                            if (
-                                (matches > 1)
-                                and src[i + matches : i + matches + 1]
-                                and (priority0 != ord('-'))
-                            ):
-                                char0 = src[i + matches - 1]
-                                pos0 = alpha_pos[char0]
-
-                                if pos0 >= 2 and src[i + matches]:
-                                    xpos = pos0 - 2
-                                    pos0 = alpha_pos[src[i + matches]]
-                                    start3 = phonet_hash_1[xpos, pos0]
-                                    start4 = phonet_hash_1[xpos, 0]
-                                    end3 = phonet_hash_2[xpos, pos0]
-                                    end4 = phonet_hash_2[xpos, 0]
-
-                                    # preserve rule priorities
-                                    if (start4 >= 0) and (
-                                        (start3 < 0) or (start4 < start3)
-                                    ):
-                                        pos0 = start3
-                                        start3 = start4
-                                        start4 = pos0
-                                        pos0 = end3
-                                        end3 = end4
-                                        end4 = pos0
-
-                                    if (end3 >= start4) and (start4 >= 0):
-                                        if end4 > end3:
-                                            end3 = end4
-
-                                        start4 = -1
-                                        end4 = -1
-                                else:
-                                    pos0 = phonet_hash[char0]
-                                    start3 = pos0
-                                    end3 = 10000
-                                    start4 = -1
-                                    end4 = -1
-
-                                pos0 = start3
-
-                            # check continuation rules for src[i+matches]
-                            if pos0 >= 0:
-                                while (_phonet_rules[pos0] is None) or (
-                                    cast(str, _phonet_rules[pos0])[0] == char0
-                                ):
-                                    if pos0 > end3:
-                                        if start4 > 0:
-                                            pos0 = start4
-                                            start3 = start4
-                                            start4 = -1
-                                            end3 = end4
-                                            end4 = -1
-                                            continue
-
-                                        priority0 = -1
-
-                                        # important
-                                        break
-
-                                    if (_phonet_rules[pos0] is None) or (
-                                        _phonet_rules[pos0 + mode] is None
-                                    ):
-                                        # no conversion rule available
-                                        pos0 += 3
-                                        continue
-
-                                    # check whole string
-                                    matches0 = matches
-                                    priority0 = 5
-                                    rule = cast(str, _phonet_rules[pos0])[1:]
-
-                                    while (
-                                        rule
-                                        and (
-                                            src[
-                                                i + matches0 : i + matches0 + 1
-                                            ]
-                                            == rule[0]
-                                        )
-                                        and (
-                                            not rule[0].isdigit()
-                                            or (rule in '(-<^$')
-                                        )
-                                    ):
-                                        matches0 += 1
-                                        rule = rule[1:]
-
-                                    if rule and rule[0] == '(':
-                                        # check an array of letters
-                                        if src[
-                                            i + matches0 : i + matches0 + 1
-                                        ].isalpha() and (
-                                            src[i + matches0] in rule[1:]
-                                        ):
-                                            matches0 += 1
-
-                                            while rule and rule[0] != ')':
-                                                rule = rule[1:]
-
-                                            # if rule[0] == ')':
-                                            rule = rule[1:]
-
-                                    while rule and rule[0] == '-':
-                                        # "matches0" is NOT decremented
-                                        # because of
-                                        #    "if (matches0 == matches)"
-                                        rule = rule[1:]
-
-                                    if rule and rule[0] == '<':
-                                        rule = rule[1:]
-
-                                    if rule and rule[0].isdigit():
-                                        priority0 = int(rule[0])
-                                        rule = rule[1:]
-
-                                    if (
-                                        not rule
-                                        # rule == '^' is not possible here
-                                        or (
-                                            (rule[0] == '$')
-                                            and not src[
-                                                i + matches0 : i + matches0 + 1
-                                            ].isalpha()
-                                            and (
-                                                src[
-                                                    i
-                                                    + matches0 : i
-                                                    + matches0
-                                                    + 1
-                                                ]
-                                                != '.'
-                                            )
-                                        )
-                                    ):
-                                        if matches0 == matches:
-                                            # this is only a partial string
-                                            pos0 += 3
-                                            continue
-
-                                        if priority0 < priority:
-                                            # priority is too low
-                                            pos0 += 3
-                                            continue
-
-                                        # continuation rule found
-                                        break
-
-                                    pos0 += 3
-
-                                # end of "while"
-                                if (priority0 >= priority) and (
-                                    (_phonet_rules[pos0] is not None)
-                                    and (
-                                        cast(str, _phonet_rules[pos0])[0]
-                                        == char0
-                                    )
-                                ):
-
-                                    pos += 3
-                                    continue
-
-                            # replace string
-                            if _phonet_rules[pos] and (
-                                '<' in cast(str, _phonet_rules[pos])[1:]
-                            ):
-                                priority0 = 1
-                            else:
-                                priority0 = 0
-
-                            rule = cast(str, _phonet_rules[pos + mode])
-
-                            if (priority0 == 1) and (zeta == 0):
-                                # rule with '<' is applied
-                                if (
-                                    (j > 0)
-                                    and rule
-                                    and (
-                                        (dest[j - 1] == char)
-                                        or (dest[j - 1] == rule[0])
-                                    )
-                                ):
-                                    j -= 1
+        word = unicode_normalize('NFKC', word)
+        return _phonet_cached(word, self._mode, self._lang)
 
-                                zeta0 = 1
-                                zeta += 1
-                                matches0 = 0
 
-                                while rule and src[i + matches0]:
-                                    src = (
-                                        src[0 : i + matches0]
-                                        + rule[0]
-                                        + src[i + matches0 + 1 :]
-                                    )
-                                    matches0 += 1
-                                    rule = rule[1:]
+@lru_cache(maxsize=None)
+def _phonet_state(lang: str) -> _PhonetState:
+    """Return the matcher state of a language's rules.
 
-                                if matches0 < matches:
-                                    src = (
-                                        src[0 : i + matches0]
-                                        + src[i + matches :]
-                                    )
+    Each rule table is compiled the first time it is used, rather than when
+    the module is imported.
 
-                                char = src[i]
-                            else:
-                                i = i + matches - 1
-                                zeta = 0
-
-                                while len(rule) > 1:
-                                    if (j == 0) or (dest[j - 1] != rule[0]):
-                                        dest = (
-                                            dest[0:j]
-                                            + rule[0]
-                                            + dest[min(len(dest), j + 1) :]
-                                        )
-                                        j += 1
-
-                                    rule = rule[1:]
-
-                                # new "current char"
-                                if not rule:
-                                    rule = ''
-                                    char = ''
-                                else:
-                                    char = rule[0]
+    Parameters
+    ----------
+    lang : str
+        ``de`` for German, ``none`` for no language
 
-                                if (
-                                    _phonet_rules[pos]
-                                    and '^^'
-                                    in cast(str, _phonet_rules[pos])[1:]
-                                ):
-                                    if char:
-                                        dest = (
-                                            dest[0:j]
-                                            + char
-                                            + dest[min(len(dest), j + 1) :]
-                                        )
-                                        j += 1
-
-                                    src = src[i + 1 :]
-                                    i = 0
-                                    zeta0 = 1
+    Returns
+    -------
+    _PhonetState
+        The compiled matcher state
 
-                            break
-
-                        pos += 3
+    .. versionadded:: 0.6.0
 
-                        if pos > end1 and start2 > 0:
-                            pos = start2
-                            start1 = start2
-                            end1 = end2
-                            start2 = -1
-                            end2 = -1
+    """
+    if lang == 'none':
+        return _compile_phonet(Phonet._rules_no_lang)
+    return _compile_phonet(Phonet._rules_german)
 
-                if zeta0 == 0:
-                    if char and ((j == 0) or (dest[j - 1] != char)):
-                        # delete multiple letters only
-                        dest = (
-                            dest[0:j] + char + dest[min(j + 1, term_length) :]
-                        )
-                        j += 1
 
-                    i += 1
-                    zeta = 0
+@lru_cache(maxsize=16384)
+def _phonet_cached(term: str, mode: int, lang: str) -> str:
+    """Return the phonet coded form of a term, caching recent results.
 
-            dest = dest[0:j]
+    Parameters
+    ----------
+    term : str
+        Term to transform
+    mode : int
+        The ponet variant to employ (1 or 2)
+    lang : str
+        ``de`` (default) for German, ``none`` for no language
 
-            return dest
+    Returns
+    -------
+    str
+        The phonet value
 
-        _initialize_phonet(self._lang)
+    .. versionadded:: 0.6.0
 
-        word = unicode_normalize('NFKC', word)
-        return _phonet(word, self._mode, self._lang)
+    """
+    state = _phonet_state('none' if lang == 'none' else 'de')
+
+    return _phonet(
+        term,
+        mode,
+        state.dispatch[mode - 1],
+        state.alpha_pos,
+        Phonet._upper_trans,
+    )
 
 
 if __name__ == '__main__':
@@ -19,10 +19,143 @@
 The phonetic._phonetic module implements abstract class Phonetic.
 """
 
+from functools import lru_cache, update_wrapper
 from itertools import groupby
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from unicodedata import normalize as unicode_normalize
 
 __all__ = ['_Phonetic']
 
+_Encode = TypeVar('_Encode', bound=Callable[..., str])
+
+
+class _DeletionTable(Dict[int, Optional[str]]):
+    """A str.translate table that deletes any character it does not map.
+
+    Characters not yet in the table are added on first sight, so that later
+    lookups of them stay in C, until the table holds _maxsize entries. The
+    tables are shared class attributes, so this bounds their growth.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _maxsize = 4096
+
+    def __missing__(self, key: int) -> None:
+        """Return the deletion mapping of an unmapped character.
+
+        Parameters
+        ----------
+        key : int
+            The ordinal of the character
+
+        Returns
+        -------
+        None
+            The mapping that deletes the character
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(self) < self._maxsize:
+            self[key] = None
+        return None
+
+
+def _cache_encode(
+    maxsize: int = 16384, maxsettings: int = 64
+) -> Callable[[_Encode], _Encode]:
+    """Return a decorator that memoizes an encode method.
+
+    Encoders whose output depends only on the word and on their instance
+    attributes decorate their encode method with this. Codes are kept in one
+    dict per class & attribute values, outside of the instances, so instances
+    with the same settings share codes and stay picklable. The attribute
+    values are read on every call, so changing a setting after a call never
+    returns codes made under the old one. A dict is emptied once it holds
+    maxsize codes, all of the dicts are dropped once there are maxsettings of
+    them, and all of them can be dropped with ``encode.cache_clear()``. Calls
+    with keyword arguments are not cached.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of encodings to keep per settings (defaults to
+        16384)
+    maxsettings : int
+        The maximum number of distinct settings to keep encodings for
+        (defaults to 64)
+
+    Returns
+    -------
+    Callable
+        The decorator
+
+
+    .. versionadded:: 0.6.0
+
+    """
+
+    def decorator(encode: _Encode) -> _Encode:
+        caches = {}  # type: Dict[Tuple[Any, ...], Dict[str, str]]
+
+        def cached_encode(self: '_Phonetic', word: str, **kwargs: Any) -> str:
+            if kwargs:
+                return encode(self, word, **kwargs)
+            settings = (type(self), tuple(self.__dict__.items()))
+            codes = caches.get(settings)
+            if codes is None:
+                if len(caches) >= maxsettings:
+                    caches.clear()
+                codes = caches[settings] = {}
+            code = codes.get(word)
+            if code is None:
+                if len(codes) >= maxsize:
+                    codes.clear()
+                code = codes[word] = encode(self, word)
+            return code
+
+        def cache_clear() -> None:
+            caches.clear()
+
+        update_wrapper(cached_encode, encode)
+        cached_encode.cache_clear = cache_clear  # type: ignore
+        return cast(_Encode, cached_encode)
+
+    return decorator
+
+
+@lru_cache(maxsize=4096)
+def _nfkd_upper(word: str) -> str:
+    """Return the NFKD decomposition of a word, in uppercase.
+
+    Parameters
+    ----------
+    word : str
+        The word to transform
+
+    Returns
+    -------
+    str
+        The uppercased, decomposed word
+
+    .. versionadded:: 0.6.0
+
+    """
+    return unicode_normalize('NFKD', word.upper())
+
 
 class _Phonetic:
     """Abstract Phonetic class.
@@ -36,6 +169,8 @@ class _Phonetic:
     _lc_v_set = set('aeiou')
     _uc_vy_set = set('AEIOUY')
     _lc_vy_set = set('aeiouy')
+    # str.translate table that keeps only the characters in _uc_set
+    _uc_trans = _DeletionTable((ord(_), _) for _ in _uc_set)
 
     def _delete_consecutive_repeats(self, word: str) -> str:
         """Delete consecutive repeated characters in a word.
@@ -67,7 +202,7 @@ class _Phonetic:
             Encapsulated in class
 
         """
-        return ''.join(char for char, _ in groupby(word))
+        return ''.join(map(itemgetter(0), groupby(word)))
 
     def encode(self, word: str) -> str:
         """Encode phonetically.
@@ -83,6 +218,42 @@ class _Phonetic:
         """
         return word
 
+    def encode_many(self, words: Iterable[str]) -> List[str]:
+        """Encode a collection of words phonetically.
+
+        Each distinct word is encoded only once, which suits columns of names
+        with many repeats.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The words to transform
+
+        Returns
+        -------
+        list of str
+            The encoded words, in the order of the words
+
+        Examples
+        --------
+        >>> pe = _Phonetic()
+        >>> pe.encode_many(['Smith', 'Schmidt', 'Smith'])
+        ['Smith', 'Schmidt', 'Smith']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        encode = self.encode
+        codes = {}  # type: Dict[str, str]
+        encoded = []  # type: List[str]
+        for word in words:
+            code = codes.get(word)
+            if code is None:
+                code = codes[word] = encode(word)
+            encoded.append(code)
+        return encoded
+
     def encode_alpha(self, word: str) -> str:
         """Encode phonetically using alphabetic characters.
 
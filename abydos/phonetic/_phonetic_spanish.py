@@ -19,9 +19,7 @@
 Phonetic Spanish
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['PhoneticSpanish']
 
@@ -124,7 +122,7 @@ class PhoneticSpanish(_Phonetic):
 
         """
         # uppercase, normalize, and decompose, filter to A-Z minus vowels & W
-        word = unicode_normalize('NFKD', word.upper())
+        word = _nfkd_upper(word)
         word = ''.join(c for c in word if c in self._uc_set)
 
         # merge repeated Ls & Rs
@@ -19,9 +19,7 @@
 Phonex
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['Phonex']
 
@@ -121,7 +119,7 @@ class Phonex(_Phonetic):
             Encapsulated in class
 
         """
-        name = unicode_normalize('NFKD', word.upper())
+        name = _nfkd_upper(word)
 
         name_code = last = ''
 
@@ -20,9 +20,8 @@ Phonix
 """
 
 from typing import Any, Optional, Set, Tuple
-from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['Phonix']
 
@@ -402,8 +401,8 @@ class Phonix(_Phonetic):
 
         sdx = ''
 
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = _nfkd_upper(word)
+        word = word.translate(self._uc_trans)
         if word:
             for trans in self._substitutions:
                 word = repl_at[trans[0]](word, *trans[1:])
@@ -19,9 +19,7 @@
 PSHP Soundex/Viewex Coding for first names
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['PSHPSoundexFirst']
 
@@ -156,8 +154,8 @@ class PSHPSoundexFirst(_Phonetic):
             Encapsulated in class
 
         """
-        fname = unicode_normalize('NFKD', fname.upper())
-        fname = ''.join(c for c in fname if c in self._uc_set)
+        fname = _nfkd_upper(fname)
+        fname = fname.translate(self._uc_trans)
 
         # special rules
         if fname == 'JAMES':
@@ -19,9 +19,7 @@
 PSHP Soundex/Viewex Coding for last names
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['PSHPSoundexLast']
 
@@ -132,8 +130,8 @@ class PSHPSoundexLast(_Phonetic):
             Encapsulated in class
 
         """
-        lname = unicode_normalize('NFKD', lname.upper())
-        lname = ''.join(c for c in lname if c in self._uc_set)
+        lname = _nfkd_upper(lname)
+        lname = lname.translate(self._uc_trans)
 
         # A. Prefix treatment
         if lname[:3] == 'VON' or lname[:3] == 'VAN':
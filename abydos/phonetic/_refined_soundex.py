@@ -19,9 +19,7 @@
 Refined Soundex
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['RefinedSoundex']
 
@@ -134,8 +132,8 @@ class RefinedSoundex(_Phonetic):
 
         """
         # uppercase, normalize, decompose, and filter non-A-Z out
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = _nfkd_upper(word)
+        word = word.translate(self._uc_trans)
 
         # apply the Soundex algorithm
         sdx = word[:1] + word[1:].translate(self._trans)
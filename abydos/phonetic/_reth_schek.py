@@ -19,7 +19,7 @@
 Reth-Schek Phonetik
 """
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['RethSchek']
 
@@ -115,6 +115,14 @@ class RethSchek(_Phonetic):
         },
     }
 
+    _umlaut_trans = {ord('Ä'): 'AE', ord('Ö'): 'OE', ord('Ü'): 'UE'}
+
+    # The replacements tables, longest first
+    _replacements_by_length = tuple(
+        sorted(_replacements.items(), reverse=True)
+    )
+
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return Reth-Schek Phonetik code for a word.
 
@@ -152,20 +160,16 @@ class RethSchek(_Phonetic):
         word = word.upper()
 
         # Replace umlauts/eszett
-        word = word.replace('Ä', 'AE')
-        word = word.replace('Ö', 'OE')
-        word = word.replace('Ü', 'UE')
+        word = word.translate(self._umlaut_trans)
 
         # Main loop, using above replacements table
+        replacements = self._replacements_by_length
         pos = 0
         while pos < len(word):
-            for num in range(3, 0, -1):
-                if word[pos : pos + num] in self._replacements[num]:
-                    word = (
-                        word[:pos]
-                        + self._replacements[num][word[pos : pos + num]]
-                        + word[pos + num :]
-                    )
+            for num, replacements_num in replacements:
+                replacement = replacements_num.get(word[pos : pos + num])
+                if replacement is not None:
+                    word = word[:pos] + replacement + word[pos + num :]
                     pos += 1
                     break
             else:
@@ -19,13 +19,41 @@
 Roger Root phonetic algorithm
 """
 
+from typing import Dict, Tuple
 from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['RogerRoot']
 
 
+def _index_by_first_letter(
+    patterns: Dict[int, Dict[str, str]],
+) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Group a pattern table by first letter, longest patterns first.
+
+    Parameters
+    ----------
+    patterns : dict
+        A table of patterns & their digits, keyed by pattern length
+
+    Returns
+    -------
+    dict
+        The (pattern, digits) pairs starting with each letter
+
+    .. versionadded:: 0.6.0
+
+    """
+    index = {}  # type: Dict[str, Tuple[Tuple[str, str], ...]]
+    for num in sorted(patterns, reverse=True):
+        for pattern, digits in patterns[num].items():
+            index[pattern[0]] = index.get(pattern[0], ()) + (
+                (pattern, digits),
+            )
+    return index
+
+
 class RogerRoot(_Phonetic):
     """Roger Root code.
 
@@ -128,6 +156,10 @@ class RogerRoot(_Phonetic):
         },
     }
 
+    # The pattern tables, by first letter & longest first
+    _init_patterns_by_letter = _index_by_first_letter(_init_patterns)
+    _med_patterns_by_letter = _index_by_first_letter(_med_patterns)
+
     _alphabetic_initial = dict(zip((ord(_) for _ in '012345'), ' AHJWY'))
     _alphabetic = dict(zip((ord(_) for _ in '0123456789'), 'STNMRLJKFP'))
 
@@ -183,6 +215,7 @@ class RogerRoot(_Phonetic):
             1:
         ].translate(self._alphabetic)
 
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the Roger Root code for a word.
 
@@ -216,27 +249,29 @@ class RogerRoot(_Phonetic):
         """
         # uppercase, normalize, decompose, and filter non-A-Z out
         word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = word.translate(self._uc_trans)
 
-        code = ''
+        codes = []
         pos = 0
 
         # Do first digit(s) first
-        for num in range(4, 0, -1):
-            if word[:num] in self._init_patterns[num]:
-                code = self._init_patterns[num][word[:num]]
-                pos += num
+        for pattern, digits in self._init_patterns_by_letter.get(word[:1], ()):
+            if word.startswith(pattern):
+                codes.append(digits)
+                pos += len(pattern)
                 break
 
         # Then code subsequent digits
+        med_patterns = self._med_patterns_by_letter
         while pos < len(word):
-            for num in range(4, 0, -1):  # pragma: no branch
-                if word[pos : pos + num] in self._med_patterns[num]:
-                    code += self._med_patterns[num][word[pos : pos + num]]
-                    pos += num
+            candidates = med_patterns[word[pos]]
+            for pattern, digits in candidates:  # pragma: no branch
+                if word.startswith(pattern, pos):
+                    codes.append(digits)
+                    pos += len(pattern)
                     break
 
-        code = self._delete_consecutive_repeats(code)
+        code = self._delete_consecutive_repeats(''.join(codes))
         code = code.replace('*', '')
 
         if self._zero_pad:
@@ -19,9 +19,7 @@
 Robert C. Russell's Index
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['RussellIndex']
 
@@ -81,7 +79,7 @@ class RussellIndex(_Phonetic):
             Made return a str
 
         """
-        word = unicode_normalize('NFKD', word.upper())
+        word = _nfkd_upper(word)
         word = word.replace('GH', '')  # discard gh (rule 3)
         word = word.rstrip('SZ')  # discard /[sz]$/ (rule 3)
 
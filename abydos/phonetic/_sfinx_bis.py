@@ -19,6 +19,8 @@
 SfinxBis
 """
 
+from itertools import groupby
+from sys import intern
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -74,6 +76,12 @@ class SfinxBis(_Phonetic):
 
     _harde_vokaler = {'A', 'O', 'U', 'Å'}
     _mjuka_vokaler = {'E', 'I', 'Y', 'Ä', 'Ö'}
+    _alla_vokaler = frozenset(_harde_vokaler | _mjuka_vokaler)
+
+    _j_initialer = frozenset({'DJ', 'GJ', 'HJ', 'LJ'})
+    _sj_initialer_3 = frozenset({'SKJ', 'STJ', 'SCH'})
+    _sj_initialer_2 = frozenset({'SH', 'KJ', 'TJ', 'SJ'})
+
     _uc_c_set = {
         'B',
         'C',
@@ -158,6 +166,107 @@ class SfinxBis(_Phonetic):
         """
         self._max_length = max_length
 
+    def _foersvensker(self, lokal_ordet: str) -> str:
+        """Return the Swedish-ized form of the word.
+
+        Parameters
+        ----------
+        lokal_ordet : str
+            Word to transform
+
+        Returns
+        -------
+        str
+            Transformed word
+
+        .. versionadded:: 0.1.0
+
+        """
+        lokal_ordet = lokal_ordet.replace('STIERN', 'STJÄRN')
+        lokal_ordet = lokal_ordet.replace('HIE', 'HJ')
+        lokal_ordet = lokal_ordet.replace('SIÖ', 'SJÖ')
+        lokal_ordet = lokal_ordet.replace('SCH', 'SH')
+        lokal_ordet = lokal_ordet.replace('QU', 'KV')
+        lokal_ordet = lokal_ordet.replace('IO', 'JO')
+        lokal_ordet = lokal_ordet.replace('PH', 'F')
+
+        for i in self._harde_vokaler:
+            lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
+            lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
+            lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
+        for i in self._mjuka_vokaler:
+            lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
+            lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
+            lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
+
+        if 'H' in lokal_ordet:
+            for i in self._uc_c_set:
+                lokal_ordet = lokal_ordet.replace('H' + i, i)
+
+        lokal_ordet = lokal_ordet.translate(self._substitutions)
+
+        lokal_ordet = lokal_ordet.replace('Ð', 'ETH')
+        lokal_ordet = lokal_ordet.replace('Þ', 'TH')
+
+        return lokal_ordet
+
+    def _koda_foersta_ljudet(self, lokal_ordet: str) -> str:
+        """Return the word with the first sound coded.
+
+        Parameters
+        ----------
+        lokal_ordet : str
+            Word to transform
+
+        Returns
+        -------
+        str
+            Transformed word
+
+        .. versionadded:: 0.1.0
+
+        """
+        if lokal_ordet[0:1] in self._alla_vokaler:
+            lokal_ordet = '$' + lokal_ordet[1:]
+        elif lokal_ordet[0:2] in self._j_initialer:
+            lokal_ordet = 'J' + lokal_ordet[2:]
+        elif (
+            lokal_ordet[0:1] == 'G' and lokal_ordet[1:2] in self._mjuka_vokaler
+        ):
+            lokal_ordet = 'J' + lokal_ordet[1:]
+        elif lokal_ordet[0:1] == 'Q':
+            lokal_ordet = 'K' + lokal_ordet[1:]
+        elif (
+            lokal_ordet[0:2] == 'CH' and lokal_ordet[2:3] in self._alla_vokaler
+        ):
+            lokal_ordet = '#' + lokal_ordet[2:]
+        elif (
+            lokal_ordet[0:1] == 'C' and lokal_ordet[1:2] in self._harde_vokaler
+        ):
+            lokal_ordet = 'K' + lokal_ordet[1:]
+        elif lokal_ordet[0:1] == 'C' and lokal_ordet[1:2] in self._uc_c_set:
+            lokal_ordet = 'K' + lokal_ordet[1:]
+        elif lokal_ordet[0:1] == 'X':
+            lokal_ordet = 'S' + lokal_ordet[1:]
+        elif (
+            lokal_ordet[0:1] == 'C' and lokal_ordet[1:2] in self._mjuka_vokaler
+        ):
+            lokal_ordet = 'S' + lokal_ordet[1:]
+        elif lokal_ordet[0:3] in self._sj_initialer_3:
+            lokal_ordet = '#' + lokal_ordet[3:]
+        elif lokal_ordet[0:2] in self._sj_initialer_2:
+            lokal_ordet = '#' + lokal_ordet[2:]
+        elif (
+            lokal_ordet[0:2] == 'SK'
+            and lokal_ordet[2:3] in self._mjuka_vokaler
+        ):
+            lokal_ordet = '#' + lokal_ordet[2:]
+        elif (
+            lokal_ordet[0:1] == 'K' and lokal_ordet[1:2] in self._mjuka_vokaler
+        ):
+            lokal_ordet = '#' + lokal_ordet[1:]
+        return lokal_ordet
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic SfinxBis code for a word.
 
@@ -207,7 +316,8 @@ class SfinxBis(_Phonetic):
         Returns
         -------
         str
-            The SfinxBis value
+            The SfinxBis value, interned since the same codes recur heavily
+            across collections of names
 
         Examples
         --------
@@ -235,116 +345,6 @@ class SfinxBis(_Phonetic):
 
         """
 
-        def _foersvensker(lokal_ordet: str) -> str:
-            """Return the Swedish-ized form of the word.
-
-            Parameters
-            ----------
-            lokal_ordet : str
-                Word to transform
-
-            Returns
-            -------
-            str
-                Transformed word
-
-            .. versionadded:: 0.1.0
-
-            """
-            lokal_ordet = lokal_ordet.replace('STIERN', 'STJÄRN')
-            lokal_ordet = lokal_ordet.replace('HIE', 'HJ')
-            lokal_ordet = lokal_ordet.replace('SIÖ', 'SJÖ')
-            lokal_ordet = lokal_ordet.replace('SCH', 'SH')
-            lokal_ordet = lokal_ordet.replace('QU', 'KV')
-            lokal_ordet = lokal_ordet.replace('IO', 'JO')
-            lokal_ordet = lokal_ordet.replace('PH', 'F')
-
-            for i in self._harde_vokaler:
-                lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
-            for i in self._mjuka_vokaler:
-                lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
-
-            if 'H' in lokal_ordet:
-                for i in self._uc_c_set:
-                    lokal_ordet = lokal_ordet.replace('H' + i, i)
-
-            lokal_ordet = lokal_ordet.translate(self._substitutions)
-
-            lokal_ordet = lokal_ordet.replace('Ð', 'ETH')
-            lokal_ordet = lokal_ordet.replace('Þ', 'TH')
-
-            return lokal_ordet
-
-        def _koda_foersta_ljudet(lokal_ordet: str) -> str:
-            """Return the word with the first sound coded.
-
-            Parameters
-            ----------
-            lokal_ordet : str
-                Word to transform
-
-            Returns
-            -------
-            str
-                Transformed word
-
-            .. versionadded:: 0.1.0
-
-            """
-            if (
-                lokal_ordet[0:1] in self._mjuka_vokaler
-                or lokal_ordet[0:1] in self._harde_vokaler
-            ):
-                lokal_ordet = '$' + lokal_ordet[1:]
-            elif lokal_ordet[0:2] in ('DJ', 'GJ', 'HJ', 'LJ'):
-                lokal_ordet = 'J' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:1] == 'G'
-                and lokal_ordet[1:2] in self._mjuka_vokaler
-            ):
-                lokal_ordet = 'J' + lokal_ordet[1:]
-            elif lokal_ordet[0:1] == 'Q':
-                lokal_ordet = 'K' + lokal_ordet[1:]
-            elif lokal_ordet[0:2] == 'CH' and lokal_ordet[2:3] in frozenset(
-                self._mjuka_vokaler | self._harde_vokaler
-            ):
-                lokal_ordet = '#' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:1] == 'C'
-                and lokal_ordet[1:2] in self._harde_vokaler
-            ):
-                lokal_ordet = 'K' + lokal_ordet[1:]
-            elif (
-                lokal_ordet[0:1] == 'C' and lokal_ordet[1:2] in self._uc_c_set
-            ):
-                lokal_ordet = 'K' + lokal_ordet[1:]
-            elif lokal_ordet[0:1] == 'X':
-                lokal_ordet = 'S' + lokal_ordet[1:]
-            elif (
-                lokal_ordet[0:1] == 'C'
-                and lokal_ordet[1:2] in self._mjuka_vokaler
-            ):
-                lokal_ordet = 'S' + lokal_ordet[1:]
-            elif lokal_ordet[0:3] in ('SKJ', 'STJ', 'SCH'):
-                lokal_ordet = '#' + lokal_ordet[3:]
-            elif lokal_ordet[0:2] in ('SH', 'KJ', 'TJ', 'SJ'):
-                lokal_ordet = '#' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:2] == 'SK'
-                and lokal_ordet[2:3] in self._mjuka_vokaler
-            ):
-                lokal_ordet = '#' + lokal_ordet[2:]
-            elif (
-                lokal_ordet[0:1] == 'K'
-                and lokal_ordet[1:2] in self._mjuka_vokaler
-            ):
-                lokal_ordet = '#' + lokal_ordet[1:]
-            return lokal_ordet
-
         # Steg 1, Versaler
         word = unicode_normalize('NFC', word.upper())
         word = word.replace('-', ' ')
@@ -368,7 +368,7 @@ class SfinxBis(_Phonetic):
             return ''
 
         # Steg 4, Försvenskning
-        ordlista = [_foersvensker(ordet) for ordet in ordlista]
+        ordlista = [self._foersvensker(ordet) for ordet in ordlista]
 
         # Steg 5, Ta bort alla tecken som inte är A-Ö (65-90,196,197,214)
         ordlista = [
@@ -377,7 +377,7 @@ class SfinxBis(_Phonetic):
         ]
 
         # Steg 6, Koda första ljudet
-        ordlista = [_koda_foersta_ljudet(ordet) for ordet in ordlista]
+        ordlista = [self._koda_foersta_ljudet(ordet) for ordet in ordlista]
 
         # Steg 7, Dela upp namnet i två delar
         rest = [ordet[1:] for ordet in ordlista]
@@ -392,10 +392,14 @@ class SfinxBis(_Phonetic):
         rest = [ordet.translate(self._trans) for ordet in rest]
 
         # Steg 10, Ta bort intilliggande dubbletter
-        rest = [self._delete_consecutive_repeats(ordet) for ordet in rest]
-
         # Steg 11, Ta bort alla "9"
-        rest = [ordet.replace('9', '') for ordet in rest]
+        # (The repeats must be deleted before the "9"s, since a vowel between
+        # two like consonants keeps them distinct, so both are done in a
+        # single pass over each part.)
+        rest = [
+            ''.join([char for char, _ in groupby(ordet) if char != '9'])
+            for ordet in rest
+        ]
 
         # Steg 12, Sätt ihop delarna igen
         ordlista = [
@@ -406,7 +410,7 @@ class SfinxBis(_Phonetic):
         if self._max_length > 0:
             ordlista = [ordet[: self._max_length] for ordet in ordlista]
 
-        return ','.join(ordlista)
+        return intern(','.join(ordlista))
 
 
 if __name__ == '__main__':
@@ -19,10 +19,9 @@
 American Soundex
 """
 
-from typing import Any
 from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['Soundex']
 
@@ -134,7 +133,8 @@ class Soundex(_Phonetic):
         code = self.encode(word).rstrip('0')
         return code[:1] + code[1:].translate(self._alphabetic)
 
-    def encode(self, word: str, **kwargs: Any) -> str:
+    @_cache_encode()
+    def encode(self, word: str, **kwargs: bool) -> str:
         """Return the Soundex code for a word.
 
         Parameters
@@ -204,7 +204,7 @@ class Soundex(_Phonetic):
                 )
             # Otherwise, proceed as usual (var='American' mode, ostensibly)
 
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = word.translate(self._uc_trans)
 
         # Nothing to convert, return base case
         if not word:
@@ -19,9 +19,7 @@
 SoundexBR
 """
 
-from unicodedata import normalize as unicode_normalize
-
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['SoundexBR']
 
@@ -132,8 +130,8 @@ class SoundexBR(_Phonetic):
             Encapsulated in class
 
         """
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = _nfkd_upper(word)
+        word = word.translate(self._uc_trans)
 
         if word[:2] == 'WA':
             first = 'V'
@@ -20,9 +20,8 @@ Standardized Phonetic Frequency Code (SPFC) algorithm
 """
 
 from typing import NoReturn, Sequence, Union
-from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _nfkd_upper
 
 __all__ = ['SPFC']
 
@@ -67,6 +66,63 @@ class SPFC(_Phonetic):
     _pf2_alphabetic = dict(zip((ord(_) for _ in '0123456789'), 'SCFAODMGUE'))
     _pf3_alphabetic = dict(zip((ord(_) for _ in '01234567'), 'BDFGMRSZ'))
 
+    def _raise_word_ex(self) -> NoReturn:
+        """Raise an AttributeError.
+
+        Raises
+        ------
+        AttributeError
+            Word attribute must be a string with a space or period dividing
+            the first and last names or a tuple/list consisting of the
+            first and last names
+
+        .. versionadded:: 0.1.0
+
+        """
+        raise AttributeError(
+            'Word attribute must be a string with a space or period '
+            + 'dividing the first and last names or a tuple/list '
+            + 'consisting of the first and last names'
+        )
+
+    def _steps_one_to_three(self, name: str) -> str:
+        """Perform the first three steps of SPFC.
+
+        Parameters
+        ----------
+        name : str
+            Name to transform
+
+        Returns
+        -------
+        str
+            Transformed name
+
+        .. versionadded:: 0.1.0
+
+        """
+        # filter out non A-Z
+        name = name.translate(self._uc_trans)
+
+        # 1. In the field, convert DK to K, DT to T, SC to S, KN to N,
+        # and MN to N
+        for subst in self._substitutions:
+            name = name.replace(subst[0], subst[1])
+
+        # 2. In the name field, replace multiple letters with a single
+        # letter
+        name = self._delete_consecutive_repeats(name)
+
+        # 3. Remove vowels, W, H, and Y, but keep the first letter in the
+        # name field.
+        if name:
+            name = name[0] + ''.join(
+                _
+                for _ in name[1:]
+                if _ not in {'A', 'E', 'H', 'I', 'O', 'U', 'W', 'Y'}
+            )
+        return name
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic SPFC of a word.
 
@@ -163,25 +219,6 @@ class SPFC(_Phonetic):
 
         """
 
-        def _raise_word_ex() -> NoReturn:
-            """Raise an AttributeError.
-
-            Raises
-            ------
-            AttributeError
-                Word attribute must be a string with a space or period dividing
-                the first and last names or a tuple/list consisting of the
-                first and last names
-
-            .. versionadded:: 0.1.0
-
-            """
-            raise AttributeError(
-                'Word attribute must be a string with a space or period '
-                + 'dividing the first and last names or a tuple/list '
-                + 'consisting of the first and last names'
-            )
-
         if not word:
             return ''
 
@@ -191,56 +228,18 @@ class SPFC(_Phonetic):
             if len(names) != 2:
                 names = word.split(' ', 1)
                 if len(names) != 2:
-                    _raise_word_ex()
+                    self._raise_word_ex()
         elif hasattr(word, '__iter__'):
             if len(word) != 2:
-                _raise_word_ex()
+                self._raise_word_ex()
             names = word
         else:
-            _raise_word_ex()
+            self._raise_word_ex()
 
-        names = [unicode_normalize('NFKD', _.strip().upper()) for _ in names]
+        names = [_nfkd_upper(_.strip()) for _ in names]
         code = ''
 
-        def _steps_one_to_three(name: str) -> str:
-            """Perform the first three steps of SPFC.
-
-            Parameters
-            ----------
-            name : str
-                Name to transform
-
-            Returns
-            -------
-            str
-                Transformed name
-
-            .. versionadded:: 0.1.0
-
-            """
-            # filter out non A-Z
-            name = ''.join(_ for _ in name if _ in self._uc_set)
-
-            # 1. In the field, convert DK to K, DT to T, SC to S, KN to N,
-            # and MN to N
-            for subst in self._substitutions:
-                name = name.replace(subst[0], subst[1])
-
-            # 2. In the name field, replace multiple letters with a single
-            # letter
-            name = self._delete_consecutive_repeats(name)
-
-            # 3. Remove vowels, W, H, and Y, but keep the first letter in the
-            # name field.
-            if name:
-                name = name[0] + ''.join(
-                    _
-                    for _ in name[1:]
-                    if _ not in {'A', 'E', 'H', 'I', 'O', 'U', 'W', 'Y'}
-                )
-            return name
-
-        names = [_steps_one_to_three(_) for _ in names]
+        names = [self._steps_one_to_three(_) for _ in names]
 
         # 4. The first digit of the code is obtained using PF1 and the first
         # letter of the name field. Remove this letter after coding.
@@ -21,7 +21,7 @@ Statistics Canada phonetic encoding
 
 from unicodedata import normalize as unicode_normalize
 
-from ._phonetic import _Phonetic
+from ._phonetic import _Phonetic, _cache_encode
 
 __all__ = ['StatisticsCanada']
 
@@ -41,6 +41,9 @@ class StatisticsCanada(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    # Vowels & Y, deleted from all but the first letter, as ASCII bytes
+    _del_chars = b'AEIOUY'
+
     def __init__(self, max_length: int = 4) -> None:
         """Initialize StatisticsCanada instance.
 
@@ -55,6 +58,7 @@ class StatisticsCanada(_Phonetic):
         """
         self._max_length = max_length
 
+    @_cache_encode()
     def encode(self, word: str) -> str:
         """Return the Statistics Canada code for a word.
 
@@ -88,16 +92,12 @@ class StatisticsCanada(_Phonetic):
         """
         # uppercase, normalize, decompose, and filter non-A-Z out
         word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        word = word.translate(self._uc_trans)
         if not word:
             return ''
 
-        code = word[1:]
-        for vowel in self._uc_vy_set:
-            code = code.replace(vowel, '')
-        code = word[0] + code
-        code = self._delete_consecutive_repeats(code)
-        code = code.replace(' ', '')
+        code = word[1:].encode().translate(None, self._del_chars).decode()
+        code = self._delete_consecutive_repeats(word[0] + code)
 
         return code[: self._max_length]
 
@@ -26,6 +26,7 @@ from typing import (
     Callable,
     Counter as TCounter,
     DefaultDict,
+    KeysView,
     List,
     Optional,
     Set,
@@ -80,6 +81,7 @@ class _Tokenizer:
         self._string = ''
         self._ordered_tokens = []  # type: List[str]
         self._ordered_weights = []  # type: List[float]
+        self._counter = None  # type: Optional[TCounter[str]]
 
     def tokenize(self, string: str) -> '_Tokenizer':
         """Tokenize the term and store it.
@@ -113,6 +115,8 @@ class _Tokenizer:
         .. versionadded:: 0.6.0
 
         """
+        self._counter = None
+
         if self._scaler in {'SSK', 'length', 'length-log', 'length-exp'}:
             self._tokens = defaultdict(float)
             if cast(str, self._scaler)[:6] == 'length':
@@ -144,7 +148,11 @@ class _Tokenizer:
             ]
         else:
             self._tokens = defaultdict(int)
-            self._tokens.update(Counter(self._ordered_tokens))
+            if len(self._ordered_tokens) == 1:
+                # A single token needs no Counter to count it
+                self._tokens[self._ordered_tokens[0]] = 1
+            else:
+                self._tokens.update(Counter(self._ordered_tokens))
 
     def count(self) -> int:
         """Return token count.
@@ -164,7 +172,7 @@ class _Tokenizer:
         .. versionadded:: 0.4.0
 
         """
-        return sum(self.get_counter().values())
+        return sum(self._cached_counter().values())
 
     def count_unique(self) -> int:
         """Return the number of unique elements.
@@ -184,7 +192,47 @@ class _Tokenizer:
         .. versionadded:: 0.4.0
 
         """
-        return len(self._tokens.values())
+        return len(self._tokens)
+
+    def _build_counter(self) -> TCounter[str]:
+        """Return a new Counter of the scaled tokens.
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler == 'set':
+            return Counter(dict.fromkeys(self._tokens, 1))
+        elif callable(self._scaler):
+            return Counter(
+                {key: self._scaler(val) for key, val in self._tokens.items()}
+            )
+        else:
+            return Counter(self._tokens)
+
+    def _cached_counter(self) -> TCounter[str]:
+        """Return the tokens as a Counter object, built once per tokenization.
+
+        The Counter is shared between calls until the next tokenization, so
+        it must not be modified.
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._counter is None:
+            self._counter = self._build_counter()
+        return self._counter
 
     def get_counter(self) -> TCounter[str]:
         """Return the tokens as a Counter object.
@@ -202,16 +250,15 @@ class _Tokenizer:
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Returns a new Counter on each call, copied from the scaled
+            Counter that count and the &, + and - operators build once per
+            tokenization, if they have built it
 
         """
-        if self._scaler == 'set':
-            return Counter({key: 1 for key in self._tokens.keys()})
-        elif callable(self._scaler):
-            return Counter(
-                {key: self._scaler(val) for key, val in self._tokens.items()}
-            )
-        else:
-            return Counter(self._tokens)
+        if self._counter is None:
+            return self._build_counter()
+        return Counter(self._counter)
 
     def get_set(self) -> Set[str]:
         """Return the unique tokens as a set.
@@ -233,6 +280,31 @@ class _Tokenizer:
         """
         return set(self._tokens.keys())
 
+    def get_keys(self) -> KeysView[str]:
+        """Return the unique tokens as a keys view.
+
+        Unlike :py:meth:`get_set`, this does not copy the tokens, so it suits
+        callers that only iterate over or test membership in them. Use the
+        view before this tokenizer tokenizes another string, or use
+        :py:meth:`get_set` instead.
+
+        Returns
+        -------
+        KeysView
+            The unique tokens
+
+        Examples
+        --------
+        >>> tok = _Tokenizer().tokenize('term')
+        >>> 'term' in tok.get_keys()
+        True
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tokens.keys()
+
     def get_list(self) -> List[str]:
         """Return the tokens as an ordered list.
 
@@ -267,7 +339,7 @@ class _Tokenizer:
         .. versionadded:: 0.4.0
 
         """
-        return self.get_counter() & other.get_counter()
+        return self._cached_counter() & other._cached_counter()
 
     def __add__(self, other: '_Tokenizer') -> TCounter[str]:
         """Return union with other tokens.
@@ -275,7 +347,7 @@ class _Tokenizer:
         .. versionadded:: 0.4.0
 
         """
-        return self.get_counter() + other.get_counter()
+        return self._cached_counter() + other._cached_counter()
 
     def __sub__(self, other: '_Tokenizer') -> TCounter[str]:
         """Return difference from other tokens.
@@ -283,7 +355,7 @@ class _Tokenizer:
         .. versionadded:: 0.4.0
 
         """
-        return self.get_counter() - other.get_counter()
+        return self._cached_counter() - other._cached_counter()
 
 
 if __name__ == '__main__':
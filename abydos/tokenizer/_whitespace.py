@@ -74,6 +74,37 @@ class WhitespaceTokenizer(RegexpTokenizer):
         super(WhitespaceTokenizer, self).__init__(
             scaler, regexp=r'\S+', flags=flags
         )
+        self._flags = flags
+
+    def tokenize(self, string: str) -> 'WhitespaceTokenizer':
+        """Tokenize the term and store it.
+
+        The tokenized term is stored as an ordered list and as a Counter
+        object.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Examples
+        --------
+        >>> WhitespaceTokenizer().tokenize('AA CT  AG AA CD')
+        WhitespaceTokenizer({'AA': 2, 'CT': 1, 'AG': 1, 'CD': 1})
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._flags:
+            super(WhitespaceTokenizer, self).tokenize(string)
+            return self
+
+        # Without flags, str.split() splits on exactly the characters that
+        # \s matches, without the overhead of the regular expression engine
+        self._string = string
+        self._ordered_tokens = string.split()
+        self._scale_and_counterize()
+        return self
 
 
 if __name__ == '__main__':
@@ -19,12 +19,14 @@
 This module contains unit tests for abydos.phonetic._Phonetic
 """
 
+import pickle
 import unittest
+from copy import deepcopy
 
-from abydos.phonetic import Davidson
+from abydos.phonetic import BeiderMorse, Davidson, ParmarKumbharana, Soundex
 
 # noinspection PyProtectedMember
-from abydos.phonetic._phonetic import _Phonetic
+from abydos.phonetic._phonetic import _DeletionTable, _Phonetic
 
 
 class PhoneticTestCases(unittest.TestCase):
@@ -49,11 +51,88 @@ class PhoneticTestCases(unittest.TestCase):
             'ACTG',
         )
 
+    def test_phonetic_uc_trans(self):
+        """Test abydos.phonetic._Phonetic._uc_trans."""
+        self.assertEqual(''.translate(self.pa._uc_trans), '')  # noqa: SF01
+        self.assertEqual(
+            "O'BRIEN-SMITH, JR.".translate(self.pa._uc_trans),  # noqa: SF01
+            'OBRIENSMITHJR',
+        )
+        self.assertEqual(
+            'Müller'.translate(self.pa._uc_trans), 'M'  # noqa: SF01
+        )
+
+        # Unmapped characters are only added until the table is full
+        table = _DeletionTable({ord('A'): 'A'})
+        table._maxsize = 3  # noqa: SF01
+        self.assertEqual('ABCDE'.translate(table), 'A')
+        self.assertEqual(len(table), 3)
+
+    def test_phonetic_cache_encode(self):
+        """Test abydos.phonetic._Phonetic._cache_encode."""
+        pa = Soundex()
+        self.assertEqual(pa.encode('Christopher'), 'C623')
+        self.assertEqual(pa.encode('Christopher'), 'C623')
+        self.assertEqual(pa.encode_alpha('Christopher'), 'CRKT')
+        self.assertEqual(Soundex().encode('Christopher'), 'C623')
+
+        # Instances with different settings do not share codes
+        self.assertEqual(Soundex(max_length=6).encode('Christopher'), 'C62316')
+        self.assertEqual(Soundex(reverse=True).encode('Christopher'), 'R132')
+
+        # Settings changed after a call are not answered from the old codes
+        pa_2 = Soundex()
+        self.assertEqual(pa_2.encode('Christopher'), 'C623')
+        pa_2._max_length = 2  # noqa: SF01
+        self.assertEqual(pa_2.encode('Christopher'), 'C6')
+
+        # The cache is not kept on the instance, so instances can be copied
+        # and pickled
+        self.assertEqual(vars(pa), vars(Soundex()))
+        self.assertEqual(
+            pickle.loads(pickle.dumps(pa)).encode('Niall'),  # noqa: S301
+            'N400',
+        )
+        for enc in (
+            pickle.loads(pickle.dumps(Soundex(max_length=6))),  # noqa: S301
+            deepcopy(Soundex(max_length=6)),
+        ):
+            self.assertEqual(enc.encode('Christopher'), 'C62316')
+            self.assertEqual(enc.encode('Niall'), 'N40000')
+        bmpm = pickle.loads(pickle.dumps(BeiderMorse()))  # noqa: S301
+        self.assertEqual(bmpm.encode('Niall'), BeiderMorse().encode('Niall'))
+        self.assertEqual(
+            deepcopy(ParmarKumbharana()).encode('Christopher'), 'CHRSTPHR'
+        )
+
+        Soundex.encode.cache_clear()
+        self.assertEqual(pa.encode('Christopher'), 'C623')
+
     def test_phonetic_encode(self):
         """Test abydos.phonetic._Phonetic.encode."""
         self.assertEqual(self.pa.encode(''), '')
         self.assertEqual(self.pa.encode('word'), 'word')
 
+    def test_phonetic_encode_many(self):
+        """Test abydos.phonetic._Phonetic.encode_many."""
+        self.assertEqual(self.pa.encode_many([]), [])
+        self.assertEqual(self.pa.encode_many(['', 'word']), ['', 'word'])
+
+        encoded = []
+
+        class _Recorder(_Phonetic):
+            def encode(self, word: str) -> str:
+                encoded.append(word)
+                return word.upper()
+
+        words = iter(['Smith', 'Schmidt', 'Smith', 'Lee'])
+        self.assertEqual(
+            _Recorder().encode_many(words),
+            ['SMITH', 'SCHMIDT', 'SMITH', 'LEE'],
+        )
+        # Repeated words are only encoded once
+        self.assertEqual(encoded, ['Smith', 'Schmidt', 'Lee'])
+
     def test_phonetic_encode_alpha(self):
         """Test abydos.phonetic._Phonetic.encode_alpha."""
         self.assertEqual(self.pa.encode_alpha(''), '')
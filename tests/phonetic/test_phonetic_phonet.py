@@ -43,6 +43,10 @@ class PhonetTestCases(unittest.TestCase):
         """Test abydos.phonetic.Phonet (German)."""
         self.assertEqual(self.pa.encode(''), '')
 
+        # Only modes 1 & 2 exist
+        self.assertRaises(ValueError, Phonet, 0)
+        self.assertRaises(ValueError, Phonet, 3)
+
         # https://code.google.com/p/phonet4java/source/browse/trunk/src/test/java/com/googlecode/phonet4java/Phonet1Test.java
         self.assertEqual(self.pa_1.encode(''), '')
         self.assertEqual(self.pa_1.encode('Zedlitz'), 'ZETLIZ')
@@ -93,6 +97,13 @@ class PhonetTestCases(unittest.TestCase):
             self.pa_1.encode('Abendspaziergang'), 'ABENTSPAZIRGANK'
         )
 
+        # encode_many
+        self.assertEqual(self.pa.encode_many([]), [])
+        self.assertEqual(
+            self.pa_2.encode_many(['', 'Zedlitz', 'Schönberg', 'Zedlitz']),
+            ['', 'ZETLIZ', 'ZÖNBAK', 'ZETLIZ'],
+        )
+
     def test_phonet_nolang(self):
         """Test abydos.phonetic.Phonet (no language)."""
         self.assertEqual(Phonet(lang='none').encode(''), '')
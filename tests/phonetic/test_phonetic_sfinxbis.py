@@ -254,11 +254,15 @@ class SfinxBisTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode('skjul'), '#4')
         self.assertEqual(self.pa.encode('schul'), '#4')
         self.assertEqual(self.pa.encode('skil'), '#4')
+        self.assertEqual(self.pa.encode('Babab'), 'B11')
 
         # max_length bounds tests
         self.assertEqual(SfinxBis(max_length=-1).encode('Niall'), 'N4')
         self.assertEqual(SfinxBis(max_length=0).encode('Niall'), 'N4')
 
+        # codes are interned
+        self.assertIs(self.pa.encode('Smith'), self.pa.encode('Schmidt'))
+
         # encode_alpha
         self.assertEqual(
             self.pa.encode_alpha('Stael von Holstein'), 'STL,HLSTKN'
@@ -271,6 +275,13 @@ class SfinxBisTestCases(unittest.TestCase):
             self.pa.encode_alpha('Arjaliès-de la Lande'), '$RKLS,LNT'
         )
 
+        # encode_many
+        self.assertEqual(self.pa.encode_many([]), [])
+        self.assertEqual(
+            self.pa4.encode_many(['', 'Stael von Holstein', 'Sjöberg']),
+            ['', 'S34,H483', '#162'],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
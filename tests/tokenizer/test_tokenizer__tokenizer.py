@@ -56,6 +56,17 @@ class TokenizerTestCases(unittest.TestCase):
             Counter({'Good to be home for a night': 1}),
         )
 
+        # Changing a returned Counter does not change the tokenizer's tokens
+        tok = QGrams().tokenize('abc')
+        counter = tok.get_counter()
+        counter['zz'] = 5
+        self.assertEqual(tok.get_counter()['zz'], 0)
+        self.assertEqual(tok.count(), 4)
+        self.assertEqual(
+            tok.tokenize('b').get_counter(), Counter({'$b': 1, 'b#': 1})
+        )
+        self.assertEqual(counter['$a'], 1)
+
         nelson = QGrams().tokenize('NELSON')
         neilsen = QGrams().tokenize('NEILSEN')
         self.assertEqual(
@@ -64,6 +75,7 @@ class TokenizerTestCases(unittest.TestCase):
         self.assertEqual(
             nelson.get_list(), ['$N', 'NE', 'EL', 'LS', 'SO', 'ON', 'N#']
         )
+        self.assertEqual(set(nelson.get_keys()), nelson.get_set())
         if sys.version_info >= (3, 6):
             self.assertEqual(
                 repr(nelson),
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import re
 import unittest
 
 from abydos.tokenizer import WhitespaceTokenizer
@@ -74,6 +75,18 @@ class WhitespaceTokenizerTestCases(unittest.TestCase):
             ),
         )
 
+        # Unicode whitespace is only a separator without re.ASCII
+        self.assertEqual(
+            WhitespaceTokenizer().tokenize('a\u2003b\x1fc').get_list(),
+            ['a', 'b', 'c'],
+        )
+        self.assertEqual(
+            WhitespaceTokenizer(flags=re.ASCII)
+            .tokenize('a\u2003b\x1fc d')
+            .get_list(),
+            ['a\u2003b\x1fc', 'd'],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()